@@ -5,9 +5,17 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import odeint
 from sklearn.linear_model import LinearRegression
 
+from goldbach_primes import goldbach_partners
+from kuramoto_kernels import (goldbach_rhs, goldbach_sensitivity_rhs, order_parameter_sensitivity,
+                              partner_index)
+from kuramoto_observers import (ODEINT_MXSTEP, IntegrationFailure, SteadyStateMonitor,
+                                checked_odeint, odeint_until_steady)
+from kc_solvers import (goldbach_kc_lockstep, goldbach_kc_statistical, frequency_spread_bounds,
+                        illinois_kc, kc_sweep, newton_kc, validation_fit,
+                        warm_start_bisection)
+
 # 1. SETUP: Prime Generation
 def get_primes(n):
     sieve = np.ones(n, dtype=bool)
@@ -18,71 +26,235 @@ def get_primes(n):
     return np.where(sieve)[0].astype(float)
 
 # 2. DYNAMICS: Kuramoto with Goldbach Coupling
-def kuramoto_deriv(theta, t, omega, W, K, M):
-    diff = theta[:, None] - theta
-    interaction = np.sum(W * np.sin(diff), axis=1)
-    return omega + (K / M) * interaction
-
-def get_order_parameter(N, K, duration=20):
+# goldbach_rhs (kuramoto_kernels.py) is the O(M) partner-index form of
+# omega + (K/M) * sum_j W_ij sin(theta_i - theta_j)
+# R is NaN when odeint fails (e.g. 'Excess work done'): its partial output
+# is not a state of the system and must not be read as synchronized
+def get_order_parameter(N, K, duration=20, monitor=None):
     primes = get_primes(N)
     M = len(primes)
     omega = primes  # Natural frequencies are the primes themselves
     
-    # Goldbach Matrix
-    p_set = set(primes)
-    W = np.zeros((M, M))
-    for i, p in enumerate(primes):
-        target = N - p
-        if target in p_set:
-            j = np.where(primes == target)[0][0]
-            W[i, j] = 1.0
-            
+    # Goldbach Matrix (partial permutation -> partner index, no M x M array)
+    idx = partner_index(goldbach_partners(N, primes.astype(np.int64)))
+    
     theta0 = np.random.uniform(0, 2*np.pi, M)
     t = np.linspace(0, duration, 100)
-    sol = odeint(kuramoto_deriv, theta0, t, args=(omega, W, K, M))
+    try:
+        if monitor is not None:
+            # Stop once R(t) has settled clearly above or below the threshold;
+            # monitor.stop_time / monitor.reason record when and why
+            final_theta, _ = odeint_until_steady(goldbach_rhs, theta0, t,
+                                                 (omega, idx, K, M), monitor,
+                                                 mxstep=ODEINT_MXSTEP)
+        else:
+            sol = checked_odeint(goldbach_rhs, theta0, t, (omega, idx, K, M),
+                                 mxstep=ODEINT_MXSTEP)
+            final_theta = sol[-1]
+    except IntegrationFailure:
+        return np.nan
     
-    final_theta = sol[-1]
     R = np.abs(np.mean(np.exp(1j * final_theta)))
     return R
 
+def get_order_parameter_sensitivity(N, K, duration=20, theta0=None):
+    """
+    Final R and dR/dK from one run that carries d theta / dK alongside theta
+    (goldbach_sensitivity_rhs). Pass the same theta0 for every K so that the
+    derivative describes one trajectory family. Raises IntegrationFailure
+    when odeint fails.
+    """
+    primes = get_primes(N)
+    M = len(primes)
+    idx = partner_index(goldbach_partners(N, primes.astype(np.int64)))
+    if theta0 is None:
+        theta0 = np.random.uniform(0, 2*np.pi, M)
+    
+    y0 = np.concatenate([theta0, np.zeros(M)])
+    t = np.linspace(0, duration, 100)
+    final = checked_odeint(goldbach_sensitivity_rhs, y0, t, (primes, idx, K, M),
+                           mxstep=ODEINT_MXSTEP)[-1]
+    return order_parameter_sensitivity(final[:M], final[M:])
+
 # 3. MEASUREMENT: Search for Kc (where R crosses 0.5)
-def find_kc(N):
+# Kc is NaN when it is undecided: a run failed, or the search never saw R on
+# both sides of 0.5, so the crossing is not bracketed by [0, 2.5 N]
+def find_kc(N, early_stop=True, log=None, warm_start=None, settle=5.0, method='bisection'):
     low, high = 0, N * 2.5
+    if method in ('guided', 'newton'):
+        # Illinois steps (find_kc_guided) or Newton steps with dR/dK
+        # (find_kc_newton) from the validation fit
+        try:
+            if method == 'guided':
+                search = find_kc_guided(N, early_stop=early_stop, log=log)
+            else:
+                search = find_kc_newton(N)
+        except IntegrationFailure:
+            return np.nan
+        # Without convergence kappa_c is only a bracket edge
+        return search['kappa_c'] if search['converged'] else np.nan
+    if method == 'statistical':
+        # Sequential test on the seed-averaged R per step; seeded from the
+        # per-N legacy RNG of kc_sweep, NaN unless [0, 2.5 N] brackets Kc
+        return goldbach_kc_statistical(N, seed=np.random.randint(2**31))['kappa_c']
+    if warm_start is not None:
+        # 'forward' / 'backward': every midpoint continues from the settled
+        # phases of a bracket end (kc_solvers.warm_start_bisection) and only
+        # runs for settle time units instead of a fresh 20-unit transient
+        return find_kc_warm(N, low, high, branch=warm_start, settle=settle)
     for _ in range(10):  # Binary search for precision
         mid = (low + high) / 2
-        if get_order_parameter(N, mid) > 0.5:
+        monitor = SteadyStateMonitor(threshold=0.5) if early_stop else None
+        R = get_order_parameter(N, mid, monitor=monitor)
+        if log is not None and monitor is not None:
+            log.append((mid, R, monitor.stop_time, monitor.reason))
+        if np.isnan(R):
+            return np.nan  # Integrator failed: this step cannot be decided
+        if R > 0.5:
             high = mid
         else:
             low = mid
+    if high == N * 2.5 or low == 0:
+        return np.nan  # Never crossed: the bracket edge is not a measurement
     return (low + high) / 2
 
+def find_kc_warm(N, low, high, branch='forward', settle=5.0, duration=20, n_iter=10):
+    primes = get_primes(N)
+    M = len(primes)
+    idx = partner_index(goldbach_partners(N, primes.astype(np.int64)))
+    
+    def run(length):
+        t = np.linspace(0, length, max(int(5 * length), 2))
+        return lambda theta, K: checked_odeint(goldbach_rhs, theta, t, (primes, idx, K, M),
+                                               mxstep=ODEINT_MXSTEP)[-1]
+    
+    theta0 = np.random.uniform(0, 2*np.pi, M)
+    try:
+        result = warm_start_bisection(run(settle), low, high, theta0, threshold=0.5,
+                                      n_iter=n_iter, warmup=run(duration), branch=branch)
+    except IntegrationFailure:
+        return np.nan
+    return result['kappa_c']
+
+def find_kc_guided(N, tol=1.0, early_stop=True, log=None):
+    """
+    find_kc from model-guided brackets: the logged fit of validation_results.txt
+    as first guess, bounded by [0, 2.5 N] and the pair-locking window of the
+    prime frequencies, then Illinois steps on R(K) - 0.5 down to width tol.
+    Returns the illinois_kc result dict ('kappa_c', 'n_evaluations', ...);
+    raises IntegrationFailure when a run fails.
+    """
+    primes = get_primes(N)
+    idx = partner_index(goldbach_partners(N, primes.astype(np.int64)))
+    lower, upper = frequency_spread_bounds(primes, idx, len(primes))
+    alpha, beta = validation_fit()
+    
+    def evaluate(K):
+        monitor = SteadyStateMonitor(threshold=0.5) if early_stop else None
+        R = get_order_parameter(N, K, monitor=monitor)
+        if log is not None and monitor is not None:
+            log.append((K, R, monitor.stop_time, monitor.reason))
+        if np.isnan(R):
+            raise IntegrationFailure(f"odeint failed at N={N}, K={K}")
+        return R
+    
+    return illinois_kc(evaluate, alpha * N + beta, lower=lower, upper=min(upper, 2.5 * N),
+                       threshold=0.5, tol=tol)
+
+def find_kc_newton(N, tol=1.0, max_evals=12):
+    """
+    Safeguarded Newton search for Kc on R(K) - 0.5, with dR/dK from the
+    forward sensitivities; same guess and bounds as find_kc_guided. One
+    initial phase vector is shared by all runs.
+    Returns the newton_kc result dict ('kappa_c', 'n_evaluations', ...);
+    raises IntegrationFailure when a run fails.
+    """
+    primes = get_primes(N)
+    idx = partner_index(goldbach_partners(N, primes.astype(np.int64)))
+    lower, upper = frequency_spread_bounds(primes, idx, len(primes))
+    alpha, beta = validation_fit()
+    theta0 = np.random.uniform(0, 2*np.pi, len(primes))
+    
+    return newton_kc(lambda K: get_order_parameter_sensitivity(N, K, theta0=theta0),
+                     alpha * N + beta, lower=lower, upper=min(upper, 2.5 * N),
+                     threshold=0.5, tol=tol, max_evals=max_evals)
+
+def report_kc(result):
+    stops = result['log']
+    if np.isnan(result['kc']):
+        if stops and stops[-1][3] == 'failed':
+            print(f"N={result['N']:4d} | Kc undecided (odeint failed)")
+        else:
+            print(f"N={result['N']:4d} | Kc undecided (R = 0.5 not bracketed)")
+        return
+    if not stops:  # warm-started bisection: no early-stop monitor
+        print(f"N={result['N']:4d} | Measured Kc ≈ {result['kc']:.2f}")
+        return
+    early = [s for s in stops if s[3] != 'horizon']
+    mean_stop = np.mean([s[2] for s in stops])
+    print(f"N={result['N']:4d} | Measured Kc ≈ {result['kc']:.2f} | early stops {len(early)}/{len(stops)}, mean t_stop = {mean_stop:.1f}")
+
 # --- EXECUTION ---
-N_vals = [200, 300, 400, 500, 600, 700, 800]
-kc_results = []
-
-print("Running Dynamical Scaling Test (v4)...")
-for N in N_vals:
-    kc = find_kc(N)
-    kc_results.append(kc)
-    print(f"N={N:4d} | Measured Kc ≈ {kc:.2f}")
-
-# --- ANALYSIS ---
-X = np.array(N_vals).reshape(-1, 1)
-y = np.array(kc_results)
-model = LinearRegression().fit(X, y)
-alpha = model.coef_[0]
-r2 = model.score(X, y)
-
-print(f"\nScaling Slope (alpha): {alpha:.4f}")
-print(f"R-squared: {r2:.5f}")
-
-# --- PLOT ---
-plt.figure(figsize=(10, 6))
-plt.scatter(N_vals, kc_results, color='green', s=100, label="Simulation Data")
-plt.plot(N_vals, model.predict(X), 'k--', label=f"Scaling Law (Kc ≈ {alpha:.2f}*N)")
-plt.title("Dynamical Scaling of Goldbach Resonance", fontsize=14)
-plt.xlabel("N (Number Scale)", fontsize=12)
-plt.ylabel("Critical Coupling (Kc)", fontsize=12)
-plt.legend()
-plt.grid(True, alpha=0.3)
-plt.show()
\ No newline at end of file
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Dynamical scaling test (v4)")
+    parser.add_argument('--sweep', action='store_true',
+                        help="one odeint bisection per N in a process pool (find_kc, early stop) "
+                             "instead of the batched lockstep bisection")
+    parser.add_argument('--warm-start', choices=('forward', 'backward'),
+                        help="with --sweep: warm-started bisection along this branch")
+    parser.add_argument('--method', choices=('bisection', 'guided', 'newton', 'statistical'),
+                        default='bisection',
+                        help="with --sweep: Kc search per N (guided: Illinois steps "
+                             "from the validation fit; newton: Newton steps with dR/dK; "
+                             "statistical: sequential test on the seed-averaged R)")
+    args = parser.parse_args()
+    if (args.warm_start or args.method != 'bisection') and not args.sweep:
+        parser.error("--warm-start and --method apply to --sweep only")
+    if args.warm_start and args.method != 'bisection':
+        parser.error("--warm-start applies to --method bisection only")
+
+    N_vals = [200, 300, 400, 500, 600, 700, 800]
+
+    print("Running Dynamical Scaling Test (v4)...")
+    if args.sweep:
+        # One bisection per N in a process pool; results print as they finish
+        sweep = kc_sweep(find_kc, N_vals, seed=0, collect_log=True, callback=report_kc,
+                         warm_start=args.warm_start, method=args.method)
+        kc_results = sweep['kc']
+        print(f"Sweep wall time: {sweep['wall_time']:.1f} s")
+    else:
+        # All N bisect in lockstep: one batched (num_N, M_max) simulation per round
+        sweep = goldbach_kc_lockstep(N_vals, n_iter=10, duration=20)
+        kc_results = sweep['kappa_c']
+        for N, kc in zip(N_vals, kc_results):
+            if np.isfinite(kc):
+                print(f"N={N:4d} | Measured Kc ≈ {kc:.2f}")
+            else:
+                print(f"N={N:4d} | Kc undecided (R = 0.5 not crossed in [0, {2.5 * N:g}])")
+        print(f"Batched simulations: {sweep['n_evaluations']}")
+
+    # --- ANALYSIS --- (undecided N are left out)
+    valid = np.isfinite(kc_results)
+    X = np.array(N_vals)[valid].reshape(-1, 1)
+    y = np.array(kc_results)[valid]
+    if len(y) < 2:
+        raise SystemExit(f"\nOnly {len(y)} of {len(N_vals)} N decided: no scaling fit")
+    model = LinearRegression().fit(X, y)
+    alpha = model.coef_[0]
+    r2 = model.score(X, y)
+
+    print(f"\nScaling Slope (alpha): {alpha:.4f}")
+    print(f"R-squared: {r2:.5f} ({len(y)} of {len(N_vals)} N)")
+
+    # --- PLOT ---
+    plt.figure(figsize=(10, 6))
+    plt.scatter(X.ravel(), y, color='green', s=100, label="Simulation Data")
+    plt.plot(X.ravel(), model.predict(X), 'k--', label=f"Scaling Law (Kc ≈ {alpha:.2f}*N)")
+    plt.title("Dynamical Scaling of Goldbach Resonance", fontsize=14)
+    plt.xlabel("N (Number Scale)", fontsize=12)
+    plt.ylabel("Critical Coupling (Kc)", fontsize=12)
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    plt.show()
\ No newline at end of file
@@ -0,0 +1,172 @@
+"""
+Goldbach Bridge graph as sparse arrays.
+
+The bridge links every even n <= n_limit to the primes p, q with n = p + q.
+For an odd prime p its even neighbours are p + q for the odd primes
+q <= n_limit - p, i.e. a shifted prefix of the shared prime table, so the
+whole incidence is emitted as CSR arrays (one row per prime) without any
+per-edge Python work. networkx is only imported for the optional
+conversion.
+"""
+
+import numpy as np
+from scipy import sparse
+
+from goldbach_primes import get_primes
+
+
+class GoldbachBridge:
+    """Bipartite Goldbach bridge (even numbers x primes) in CSR form."""
+
+    def __init__(self, n_limit, primes=None):
+        """
+        Build the bridge for all even numbers 4 <= n <= n_limit.
+
+        Parameters:
+        -----------
+        n_limit : int
+            Largest even number (inclusive)
+        primes : array-like, optional
+            Sorted primes <= n_limit (defaults to the shared sieve)
+        """
+        if n_limit < 4:
+            raise ValueError("n_limit must be >= 4")
+        if primes is None:
+            primes = get_primes(n_limit + 1)
+        primes = np.asarray(primes, dtype=np.int64)
+
+        self.n_limit = n_limit
+        self.evens = np.arange(4, n_limit + 1, 2, dtype=np.int64)
+
+        # Odd primes p <-> half-index a = (p - 1) / 2; even n <-> (n - 4) / 2.
+        # p + q = n gives column a_p + a_q - 1, so row p is a[:c_p] + a_p - 1.
+        odd = primes[primes > 2]
+        a = ((odd - 1) // 2).astype(np.int32)
+        c = np.searchsorted(odd, n_limit - odd, side='right')
+        used = c > 0
+        rows = [np.zeros(1, dtype=np.int32)]  # 2 + 2 = 4
+        rows += [a[:ci] + (ai - 1) for ai, ci in zip(a[used].tolist(), c[used].tolist())]
+
+        self.primes = np.concatenate([[2], odd[used]]).astype(np.int64)
+        self.indices = np.concatenate(rows)
+        self.indptr = np.zeros(len(self.primes) + 1, dtype=np.int64)
+        self.indptr[1] = 1
+        np.cumsum(c[used], out=self.indptr[2:])
+        self.indptr[2:] += 1
+        self._graph = None
+
+    @property
+    def n_edges(self):
+        return len(self.indices)
+
+    @property
+    def n_nodes(self):
+        return len(self.evens) + len(self.primes)
+
+    def nodes(self):
+        """Node labels in matrix order: even numbers first, then primes."""
+        return np.concatenate([self.evens, self.primes])
+
+    def prime_incidence(self, dtype=float):
+        """(primes x evens) CSR incidence sharing this object's arrays."""
+        data = np.ones(self.n_edges, dtype=dtype)
+        return sparse.csr_matrix((data, self.indices, self.indptr),
+                                 shape=(len(self.primes), len(self.evens)))
+
+    def incidence(self, dtype=float):
+        """(evens x primes) incidence, as the CSC transpose of the CSR arrays."""
+        return self.prime_incidence(dtype).T
+
+    def adjacency(self, dtype=float):
+        """Symmetric adjacency of the bridge in node order (CSR)."""
+        BT = self.prime_incidence(dtype)
+        return sparse.bmat([[None, BT.T], [BT, None]], format='csr')
+
+    def laplacian(self, dtype=float):
+        """Graph Laplacian L = D - A (CSR), ready for sparse eigensolvers."""
+        A = self.adjacency(dtype)
+        degrees = np.asarray(A.sum(axis=1)).ravel()
+        return (sparse.diags(degrees) - A).tocsr()
+
+    def to_networkx(self):
+        """networkx.Graph with the same nodes and edges (built once, lazily)."""
+        if self._graph is None:
+            import networkx as nx
+            G = nx.Graph()
+            G.add_nodes_from(self.evens.tolist())
+            counts = np.diff(self.indptr)
+            p = np.repeat(self.primes, counts)
+            n = 2 * self.indices.astype(np.int64) + 4
+            G.add_edges_from(zip(n.tolist(), p.tolist()))
+            self._graph = G
+        return self._graph
+
+    def save_npz(self, path):
+        """Write the CSR arrays to a compressed .npz file."""
+        np.savez_compressed(path, n_limit=self.n_limit, primes=self.primes,
+                            indptr=self.indptr, indices=self.indices)
+
+    @classmethod
+    def load_npz(cls, path):
+        """Read a bridge written by save_npz without rebuilding it."""
+        with np.load(path) as f:
+            bridge = cls.__new__(cls)
+            bridge.n_limit = int(f['n_limit'])
+            bridge.evens = np.arange(4, bridge.n_limit + 1, 2, dtype=np.int64)
+            bridge.primes = f['primes']
+            bridge.indptr = f['indptr']
+            bridge.indices = f['indices']
+            bridge._graph = None
+        return bridge
+
+
+# ============================================================
+# LAYOUTS (O(E) or close to it; kamada_kawai is O(n^2) memory)
+# ============================================================
+def _as_layout(bridge, xy, as_array):
+    if as_array:
+        return xy
+    return dict(zip(bridge.nodes().tolist(), xy))
+
+
+def comb_layout(bridge, as_array=False):
+    """
+    Deterministic bipartite layout: even numbers on the line y = 1 and
+    primes on y = 0, both placed at x = value / n_limit.
+    """
+    values = bridge.nodes().astype(float)
+    xy = np.empty((len(values), 2))
+    xy[:, 0] = values / bridge.n_limit
+    xy[:, 1] = 0.0
+    xy[:len(bridge.evens), 1] = 1.0
+    return _as_layout(bridge, xy, as_array)
+
+
+def spectral_layout(bridge, tol=1e-8, seed=0, as_array=False):
+    """
+    Spectral layout from the two smallest nontrivial Laplacian eigenvectors.
+
+    Uses the degree-normalised Laplacian: the eigenvectors come from the
+    largest eigenpairs of the lazy walk operator (I + D^-1/2 A D^-1/2) / 2,
+    which a sparse Lanczos solver finds quickly, and are mapped back with
+    D^-1/2. The constant vectors of each connected component are dropped.
+    """
+    from scipy.sparse.csgraph import connected_components
+    from scipy.sparse.linalg import eigsh
+
+    A = bridge.adjacency()
+    n = A.shape[0]
+    degrees = np.asarray(A.sum(axis=1)).ravel()
+    inv_sqrt = np.zeros(n)
+    inv_sqrt[degrees > 0] = 1.0 / np.sqrt(degrees[degrees > 0])
+    S = sparse.diags(inv_sqrt) @ A @ sparse.diags(inv_sqrt)
+    lazy = (sparse.identity(n, format='csr') + S) * 0.5
+
+    n_components, _ = connected_components(A, directed=False)
+    k = min(n_components + 2, n - 1)
+    rng = np.random.default_rng(seed)
+    vals, vecs = eigsh(lazy, k=k, which='LA', tol=tol, v0=rng.standard_normal(n))
+    order = np.argsort(vals)[::-1][n_components:n_components + 2]
+    xy = vecs[:, order] * inv_sqrt[:, None]
+    xy /= np.maximum(np.abs(xy).max(axis=0), 1e-300)
+    return _as_layout(bridge, xy, as_array)
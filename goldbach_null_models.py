@@ -0,0 +1,240 @@
+"""
+Null-model ensembles for the Goldbach vs Random comparison.
+
+A single shuffle of W says nothing about the spread of the null
+distribution. This module draws many independent replicates of three
+null models, each generated in O(E):
+
+  * 'edges'     - the same number of ones placed uniformly in the M x M grid
+                  (the distribution sampled by np.random.shuffle(W.flat))
+  * 'involution'- a random involution with the same number of 2-cycles and
+                  fixed points as the Goldbach pairing
+  * 'rewire'    - degree-preserving double-edge swaps of the Goldbach edges
+
+Replicates run in a process pool with independent SeedSequence children and
+are folded into a streaming histogram, so memory does not grow with the
+number of replicates.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from goldbach_primes import get_primes, goldbach_edges
+
+NULL_MODELS = ('edges', 'involution', 'rewire')
+
+
+# ============================================================
+# GENERATORS (each O(E))
+# ============================================================
+def random_edge_placement(M, n_edges, rng):
+    """n_edges distinct positions drawn uniformly from the M x M grid."""
+    flat = rng.choice(M * M, size=n_edges, replace=False)
+    return flat // M, flat % M
+
+
+def random_involution(M, n_pairs, n_fixed, rng):
+    """Symmetric edge list of a random involution on M nodes."""
+    nodes = rng.choice(M, size=2 * n_pairs + n_fixed, replace=False)
+    a, b = nodes[:n_pairs], nodes[n_pairs:2 * n_pairs]
+    fixed = nodes[2 * n_pairs:]
+    rows = np.concatenate([a, b, fixed])
+    cols = np.concatenate([b, a, fixed])
+    return rows, cols
+
+
+def degree_preserving_rewire(rows, cols, rng, n_swaps=None):
+    """
+    Directed double-edge swaps (a, b), (c, d) -> (a, d), (c, b).
+
+    Row and column degrees are preserved; swaps that would create a
+    duplicate edge are rejected. Defaults to one attempted swap per edge.
+    """
+    rows = np.array(rows, dtype=np.int64)
+    cols = np.array(cols, dtype=np.int64)
+    E = len(rows)
+    if E < 2:
+        return rows, cols
+    if n_swaps is None:
+        n_swaps = E
+    present = set(zip(rows.tolist(), cols.tolist()))
+    picks = rng.integers(0, E, size=(n_swaps, 2))
+    for e, f in picks:
+        if e == f:
+            continue
+        a, b, c, d = rows[e], cols[e], rows[f], cols[f]
+        if (a, d) in present or (c, b) in present:
+            continue
+        present.difference_update(((a, b), (c, d)))
+        present.update(((a, d), (c, b)))
+        cols[e], cols[f] = d, b
+    return rows, cols
+
+
+def spectral_radius(rows, cols, M):
+    """Spectral radius max|eig(W)| of the 0/1 matrix with the given ones."""
+    if len(rows) == 0:
+        return 0.0
+    if M <= 2000:
+        W = np.zeros((M, M))
+        W[rows, cols] = 1.0
+        return float(np.max(np.abs(np.linalg.eigvals(W))))
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.linalg import eigs
+    W = csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(M, M))
+    return float(np.abs(eigs(W, k=1, which='LM', return_eigenvectors=False))[0])
+
+
+def sample_null(model, M, rows, cols, rng):
+    """One replicate (rows, cols) of the given null model."""
+    if model == 'edges':
+        return random_edge_placement(M, len(rows), rng)
+    if model == 'involution':
+        n_fixed = int(np.sum(rows == cols))
+        n_pairs = (len(rows) - n_fixed) // 2
+        return random_involution(M, n_pairs, n_fixed, rng)
+    if model == 'rewire':
+        return degree_preserving_rewire(rows, cols, rng)
+    raise ValueError(f"Unknown null model '{model}', expected one of {NULL_MODELS}")
+
+
+# ============================================================
+# STREAMING STATISTICS
+# ============================================================
+class StreamingHistogram:
+    """Fixed-bin histogram with running moments and tail counts."""
+
+    def __init__(self, bins, observed=None):
+        self.bins = np.asarray(bins, dtype=float)
+        self.counts = np.zeros(len(self.bins) - 1, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        self.observed = observed
+        self.n = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.n_ge = 0
+        self.n_le = 0
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        counts, _ = np.histogram(values, bins=self.bins)
+        self.counts += counts
+        self.underflow += int(np.sum(values < self.bins[0]))
+        self.overflow += int(np.sum(values > self.bins[-1]))
+        self.n += len(values)
+        self.total += float(np.sum(values))
+        self.total_sq += float(np.sum(values**2))
+        if self.observed is not None:
+            self.n_ge += int(np.sum(values >= self.observed))
+            self.n_le += int(np.sum(values <= self.observed))
+
+    @property
+    def mean(self):
+        return self.total / self.n if self.n else np.nan
+
+    @property
+    def std(self):
+        if self.n < 2:
+            return np.nan
+        var = (self.total_sq - self.n * self.mean**2) / (self.n - 1)
+        return float(np.sqrt(max(var, 0.0)))
+
+    def p_value(self, alternative='greater'):
+        """
+        Empirical p-value (1 + #extreme) / (1 + n) of the observed value.
+
+        'greater' tests whether the observed statistic is unusually large,
+        'less' whether it is unusually small, 'two-sided' doubles the
+        smaller tail (capped at 1).
+        """
+        if self.observed is None:
+            raise ValueError("No observed value to test")
+        upper = (1 + self.n_ge) / (1 + self.n)
+        lower = (1 + self.n_le) / (1 + self.n)
+        if alternative == 'greater':
+            return upper
+        if alternative == 'less':
+            return lower
+        if alternative == 'two-sided':
+            return min(1.0, 2 * min(upper, lower))
+        raise ValueError(f"Unknown alternative '{alternative}'")
+
+
+# ============================================================
+# PARALLEL ENSEMBLE
+# ============================================================
+def _replicate_chunk(model, M, rows, cols, seeds):
+    """Worker: spectral radii of one chunk of replicates."""
+    out = np.empty(len(seeds))
+    for k, ss in enumerate(seeds):
+        rng = np.random.default_rng(ss)
+        r, c = sample_null(model, M, rows, cols, rng)
+        out[k] = spectral_radius(r, c, M)
+    return out
+
+
+def run_null_ensemble(N, model='edges', n_replicates=1000, seed=0,
+                      n_workers=None, chunk_size=50, bins=None):
+    """
+    Null distribution of lambda_max for the Goldbach matrix at scale N.
+
+    Parameters:
+    -----------
+    N : int
+        Goldbach target
+    model : str
+        One of NULL_MODELS
+    n_replicates : int
+        Number of independent null replicates
+    seed : int
+        Root seed; replicate k always uses child k of SeedSequence(seed),
+        so results do not depend on n_workers or chunk_size
+    n_workers : int, optional
+        Process pool size (defaults to os.cpu_count(); 1 runs in-process)
+    chunk_size : int
+        Replicates per pool task
+    bins : array-like, optional
+        Histogram bin edges (defaults to 100 bins over [0, 2])
+
+    Returns:
+    --------
+    results : dict
+        'observed', 'histogram' (StreamingHistogram), 'mean', 'std',
+        'p_greater', 'p_less'
+    """
+    if model not in NULL_MODELS:
+        raise ValueError(f"Unknown null model '{model}', expected one of {NULL_MODELS}")
+    primes = get_primes(N)
+    M = len(primes)
+    rows, cols = goldbach_edges(N, primes)
+    observed = spectral_radius(rows, cols, M)
+
+    if bins is None:
+        bins = np.linspace(0.0, 2.0, 101)
+    hist = StreamingHistogram(bins, observed=observed)
+
+    seeds = np.random.SeedSequence(seed).spawn(n_replicates)
+    chunks = [seeds[i:i + chunk_size] for i in range(0, n_replicates, chunk_size)]
+    n_workers = n_workers or os.cpu_count() or 1
+
+    if n_workers == 1:
+        for chunk in chunks:
+            hist.update(_replicate_chunk(model, M, rows, cols, chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [pool.submit(_replicate_chunk, model, M, rows, cols, chunk)
+                       for chunk in chunks]
+            for fut in as_completed(futures):
+                hist.update(fut.result())
+
+    return {
+        'observed': observed,
+        'histogram': hist,
+        'mean': hist.mean,
+        'std': hist.std,
+        'p_greater': hist.p_value('greater'),
+        'p_less': hist.p_value('less'),
+    }
@@ -0,0 +1,81 @@
+"""
+Shared prime table and Goldbach partner structure.
+
+Every simulation in this repository couples the primes p < N through the
+Goldbach relation p + q = N. The coupling matrix W has at most one nonzero
+per row, so it is fully described by a partner index array.
+"""
+
+import numpy as np
+
+
+def get_primes(n):
+    """Sieve of Eratosthenes: all primes strictly below n (int64 array)."""
+    if n < 3:
+        return np.array([], dtype=np.int64)
+    sieve = np.ones(n, dtype=bool)
+    sieve[:2] = False
+    for i in range(2, int(n**0.5) + 1):
+        if sieve[i]:
+            sieve[i*i:n:i] = False
+    return np.flatnonzero(sieve).astype(np.int64)
+
+
+def goldbach_partners(N, primes=None):
+    """
+    Index of the Goldbach partner of every prime.
+
+    Parameters:
+    -----------
+    N : int
+        Goldbach target
+    primes : array-like, optional
+        Sorted primes below N (defaults to get_primes(N))
+
+    Returns:
+    --------
+    partner : ndarray of int64
+        partner[i] = j if primes[i] + primes[j] == N, otherwise -1
+    """
+    if primes is None:
+        primes = get_primes(N)
+    primes = np.asarray(primes).astype(np.int64)
+    M = len(primes)
+    q = N - primes
+    j = np.searchsorted(primes, q)
+    j_safe = np.minimum(j, max(M - 1, 0))
+    valid = (j < M) & (q > 0)
+    if M:
+        valid &= primes[j_safe] == q
+    return np.where(valid, j_safe, -1).astype(np.int64)
+
+
+def goldbach_edges(N, primes=None):
+    """Nonzero (row, col) positions of the Goldbach matrix W."""
+    partner = goldbach_partners(N, primes)
+    rows = np.flatnonzero(partner >= 0)
+    return rows, partner[rows]
+
+
+def goldbach_matrix(N, primes=None):
+    """Dense Goldbach connectivity matrix W (W[i, j] = 1 iff p_i + p_j = N)."""
+    if primes is None:
+        primes = get_primes(N)
+    M = len(primes)
+    rows, cols = goldbach_edges(N, primes)
+    W = np.zeros((M, M))
+    W[rows, cols] = 1.0
+    return W
+
+
+def goldbach_gamma(N, primes=None):
+    """
+    Goldbach weight sum Gamma(N) = sum over pairs p <= q, p + q = N of
+    1 / (ln p * ln q), as in compute_gamma (nedelchev_complete_model.py).
+    """
+    if primes is None:
+        primes = get_primes(N)
+    primes = np.asarray(primes).astype(np.int64)
+    partner = goldbach_partners(N, primes)
+    p = primes[(partner >= 0) & (2 * primes <= N)]
+    return float(np.sum(1.0 / (np.log(p) * np.log(N - p))))
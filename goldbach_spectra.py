@@ -0,0 +1,260 @@
+"""
+Spectral routines for Goldbach operators across many scales N.
+
+Dense spectra for moderate N (N <= 5000, M <= ~700) are cheap individually,
+but a sweep decomposes every N in its own Python-level call. The batched
+routine below pads a group of symmetric matrices to a common size and runs
+numpy's stacked eigvalsh once per group.
+"""
+
+import numpy as np
+
+from goldbach_primes import get_primes, goldbach_edges, goldbach_matrix
+
+
+def _group_by_size(sizes, max_batch, max_pad_ratio):
+    """Consecutive groups of size-sorted indices with bounded padding waste."""
+    order = np.argsort(sizes, kind='stable')
+    groups, current = [], []
+    for k in order:
+        if current and (len(current) >= max_batch or
+                        sizes[k] > max_pad_ratio * max(sizes[current[0]], 1)):
+            groups.append(current)
+            current = []
+        current.append(k)
+    if current:
+        groups.append(current)
+    return groups
+
+
+def batched_eigvalsh(matrices, max_batch=64, max_pad_ratio=1.25):
+    """
+    Eigenvalues of many symmetric matrices with one eigvalsh call per group.
+
+    Matrices are sorted by size and grouped so that the largest member of a
+    group is at most max_pad_ratio times the smallest. Each matrix is padded
+    to the group size with a decoupled diagonal block whose value lies above
+    every Gershgorin disc in the group; its eigenvalues therefore sort last
+    and are masked off, leaving the exact unpadded spectrum.
+
+    Parameters:
+    -----------
+    matrices : list of 2-D arrays
+        Real symmetric matrices of arbitrary (possibly different) sizes
+    max_batch : int
+        Maximum number of matrices per stacked call
+    max_pad_ratio : float
+        Maximum ratio between the largest and smallest size in a group
+
+    Returns:
+    --------
+    spectra : list of 1-D arrays
+        Ascending eigenvalues, in the order of the input matrices
+    """
+    matrices = [np.asarray(A, dtype=float) for A in matrices]
+    sizes = np.array([A.shape[0] for A in matrices])
+    spectra = [None] * len(matrices)
+
+    for group in _group_by_size(sizes, max_batch, max_pad_ratio):
+        n_max = int(sizes[group].max())
+        if n_max == 0:
+            for k in group:
+                spectra[k] = np.empty(0)
+            continue
+        sentinel = 1.0 + max(np.abs(matrices[k]).sum(axis=1).max(initial=0.0)
+                             for k in group)
+        stack = np.zeros((len(group), n_max, n_max))
+        for b, k in enumerate(group):
+            n = sizes[k]
+            stack[b, :n, :n] = matrices[k]
+            pad = np.arange(n, n_max)
+            stack[b, pad, pad] = sentinel
+        eigs = np.linalg.eigvalsh(stack)
+        for b, k in enumerate(group):
+            spectra[k] = eigs[b, :sizes[k]].copy()
+
+    return spectra
+
+
+def goldbach_laplacian(N, primes=None, normalized=True):
+    """
+    Dense Laplacian L = D - A of the Goldbach graph on the primes below N.
+
+    Self-pairs (p = N/2) are dropped. With normalized=True the matrix is
+    divided by the mean nonzero degree, giving the L~ of Theorem 1.
+    """
+    if primes is None:
+        primes = get_primes(N)
+    M = len(primes)
+    rows, cols = goldbach_edges(N, primes)
+    keep = rows != cols
+    A = np.zeros((M, M))
+    A[rows[keep], cols[keep]] = 1.0
+    degrees = A.sum(axis=1)
+    L = np.diag(degrees) - A
+    if normalized and np.any(degrees > 0):
+        L /= np.mean(degrees[degrees > 0])
+    return L
+
+
+def laplacian_spectra(N_values, normalized=True, **kwargs):
+    """Batched Goldbach Laplacian spectra for every N in N_values."""
+    return batched_eigvalsh([goldbach_laplacian(N, normalized=normalized)
+                             for N in N_values], **kwargs)
+
+
+def spectral_radii(N_values, **kwargs):
+    """Batched spectral radius max|eig(W_N)| of the Goldbach matrix per N."""
+    spectra = batched_eigvalsh([goldbach_matrix(N) for N in N_values], **kwargs)
+    return np.array([np.max(np.abs(s)) if len(s) else 0.0 for s in spectra])
+
+
+# ============================================================
+# STOCHASTIC LANCZOS QUADRATURE (sparse, bounded memory)
+# ============================================================
+def _as_sparse_laplacian(L):
+    """Accept a scipy sparse Laplacian or a networkx graph."""
+    from scipy import sparse
+    if sparse.issparse(L):
+        return L.tocsr().astype(float)
+    import networkx as nx
+    return nx.laplacian_matrix(L).tocsr().astype(float)
+
+
+def _lanczos(matvec, v0, n_steps):
+    """
+    Plain three-term Lanczos recurrence (no reorthogonalisation).
+
+    Only three vectors of length n are alive at any time. Returns the Ritz
+    values and the squared first components of the Ritz vectors (the Gauss
+    quadrature weights for the spectral measure of v0).
+    """
+    from scipy.linalg import eigh_tridiagonal
+
+    v = v0 / np.linalg.norm(v0)
+    v_prev = np.zeros_like(v)
+    alphas, betas = [], []
+    beta = 0.0
+    for _ in range(n_steps):
+        w = matvec(v)
+        alpha = float(v @ w)
+        w -= alpha * v + beta * v_prev
+        alphas.append(alpha)
+        beta = float(np.linalg.norm(w))
+        if beta < 1e-10:
+            break
+        betas.append(beta)
+        v_prev, v = v, w / beta
+    alphas = np.array(alphas)
+    betas = np.array(betas[:len(alphas) - 1])
+    nodes, vecs = eigh_tridiagonal(alphas, betas)
+    return nodes, vecs[0]**2
+
+
+def _largest_eigenvalue(matvec, n, ncv, rng):
+    """Largest eigenvalue of a symmetric operator via restarted Lanczos."""
+    from scipy.sparse.linalg import LinearOperator, eigsh
+
+    op = LinearOperator((n, n), matvec=lambda x: matvec(np.ravel(x)), dtype=float)
+    v0 = rng.standard_normal(n)
+    return float(eigsh(op, k=1, which='LA', ncv=min(ncv, n), v0=v0,
+                       return_eigenvectors=False)[0])
+
+
+def _algebraic_connectivity(L, labels, shift, ncv, rng):
+    """
+    lambda_2 of the largest connected component of a sparse Laplacian.
+
+    A component's Laplacian is the principal submatrix on its nodes. On the
+    complement of its constant vector, shift * P - P L P has spectrum
+    shift - lambda (lambda > 0), so its top eigenvalue gives lambda_2 for any
+    shift >= lambda_max.
+    """
+    giant = np.flatnonzero(labels == np.argmax(np.bincount(labels)))
+    if len(giant) < 2:
+        return 0.0, len(giant)
+    Lg = L[giant][:, giant]
+
+    def shifted(x):
+        x = x - x.mean()
+        y = Lg.dot(x)
+        return shift * x - (y - y.mean())
+
+    return shift - _largest_eigenvalue(shifted, len(giant), ncv, rng), len(giant)
+
+
+def slq_spectral_density(L, n_probes=20, n_steps=80, bins=100,
+                         ncv=20, seed=0):
+    """
+    Eigenvalue density of a sparse graph Laplacian from matvecs only.
+
+    Stochastic Lanczos quadrature: for each Rademacher probe a short Lanczos
+    run gives a Gauss quadrature of its spectral measure; averaging over
+    probes estimates the full density. Memory is O(E + n), independent of
+    the number of steps. lambda_max and lambda_2 come from implicitly
+    restarted Lanczos (ARPACK, ncv vectors). lambda_2 is the algebraic
+    connectivity of the largest connected component (the Goldbach bridge is
+    never connected: 2 + 2 = 4 forms its own component), computed on the
+    complement of that component's constant vector.
+
+    Parameters:
+    -----------
+    L : scipy sparse matrix or networkx.Graph
+        Symmetric Laplacian (or the graph to take it from)
+    n_probes : int
+        Number of random probe vectors
+    n_steps : int
+        Lanczos steps per probe
+    bins : int or array-like
+        Histogram bins for the density
+    ncv : int
+        Lanczos basis size for the lambda_2 / lambda_max estimates
+    seed : int
+        Seed for the probe vectors
+
+    Returns:
+    --------
+    results : dict
+        'counts' (estimated eigenvalue count per bin), 'bins', 'nodes',
+        'weights', 'lambda_2', 'lambda_max', 'n_components', 'giant_size'
+        (nodes in the component lambda_2 refers to)
+    """
+    from scipy.sparse.csgraph import connected_components
+
+    L = _as_sparse_laplacian(L)
+    n = L.shape[0]
+    rng = np.random.default_rng(seed)
+
+    all_nodes, all_weights = [], []
+    for _ in range(n_probes):
+        z = rng.choice([-1.0, 1.0], size=n)
+        nodes, weights = _lanczos(L.dot, z, min(n_steps, n))
+        all_nodes.append(nodes)
+        all_weights.append(weights / n_probes)
+    nodes = np.concatenate(all_nodes)
+    weights = np.concatenate(all_weights)
+
+    n_components, labels = connected_components(L, directed=False)
+
+    lambda_max = lambda_2 = 0.0
+    giant_size = 1 if n else 0
+    if n - n_components > 0:
+        lambda_max = _largest_eigenvalue(L.dot, n, ncv, rng)
+        lambda_2, giant_size = _algebraic_connectivity(L, labels, lambda_max, ncv, rng)
+
+    if np.isscalar(bins):
+        lo = min(0.0, nodes.min())
+        hi = max(lambda_max, nodes.max())
+        bins = np.linspace(lo, hi + 1e-9 * max(hi - lo, 1.0), int(bins) + 1)
+    counts, bins = np.histogram(nodes, bins=bins, weights=weights * n)
+
+    return {
+        'counts': counts,
+        'bins': bins,
+        'nodes': nodes,
+        'weights': weights,
+        'lambda_2': lambda_2,
+        'lambda_max': lambda_max,
+        'n_components': n_components,
+        'giant_size': giant_size,
+    }
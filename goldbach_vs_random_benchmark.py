@@ -6,69 +6,60 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-def get_primes(n):
-    """Generate primes up to n."""
-    sieve = np.ones(n, dtype=bool)
-    sieve[:2] = False
-    for i in range(2, int(n**0.5) + 1):
-        if sieve[i]:
-            sieve[i*i:n:i] = False
-    return np.where(sieve)[0]
+from goldbach_null_models import random_edge_placement, run_null_ensemble, spectral_radius
+from goldbach_primes import get_primes, goldbach_edges
 
-def run_benchmark(Ns):
-    print(f"{'N':>5} | {'Goldbach λ_max':>15} | {'Random λ_max':>15} | {'Result'}")
-    print("-" * 60)
+def run_benchmark(Ns, null_model='edges', n_replicates=500, seed=0):
+    print(f"{'N':>5} | {'Goldbach λ_max':>15} | {'Random λ_max':>15} | {'Null mean ± std':>17} | {'p':>7} | {'Result'}")
+    print("-" * 90)
     
     g_results = []
     r_results = []
+    rng = np.random.default_rng(seed)
     
     for N in Ns:
         primes = get_primes(N)
         M = len(primes)
-        idx = {p: i for i, p in enumerate(primes)}
         
-        # 1. GOLDBACH STRUCTURE
-        W_g = np.zeros((M, M))
-        for i, p in enumerate(primes):
-            q = N - p
-            if q in idx:
-                W_g[i, idx[q]] = 1.0
-        
-        l_max_g = np.max(np.abs(np.linalg.eigvals(W_g)))
+        # 1. GOLDBACH STRUCTURE (ones of W as an edge list)
+        rows, cols = goldbach_edges(N, primes)
+        l_max_g = spectral_radius(rows, cols, M)
         
         # 2. RANDOM STRUCTURE (Same density, shuffled topology)
-        # We take the exact same number of connections and shuffle them
-        W_r = W_g.copy().flatten()
-        np.random.shuffle(W_r)
-        W_r = W_r.reshape((M, M))
+        # We take the exact same number of connections and place them at random
+        l_max_r = spectral_radius(*random_edge_placement(M, len(rows), rng), M)
         
-        l_max_r = np.max(np.abs(np.linalg.eigvals(W_r)))
+        # 3. NULL ENSEMBLE (spread of the random distribution)
+        null = run_null_ensemble(N, model=null_model,
+                                 n_replicates=n_replicates, seed=seed + N)
         
         g_results.append(l_max_g)
         r_results.append(l_max_r)
         
         status = "UNIQUE" if abs(l_max_g - l_max_r) > 0.5 else "COMMON"
-        print(f"{N:5d} | {l_max_g:15.4f} | {l_max_r:15.4f} | {status}")
+        spread = f"{null['mean']:.4f} ± {null['std']:.4f}"
+        print(f"{N:5d} | {l_max_g:15.4f} | {l_max_r:15.4f} | {spread:>17} | {null['p_greater']:7.4f} | {status}")
         
     return g_results, r_results
 
-# --- EXECUTION ---
-Ns = [200, 400, 600, 800, 1000, 1200]
-print("Starting Benchmark: Goldbach (Order) vs Random (Chaos)...")
-goldbach_stability, random_stability = run_benchmark(Ns)
+if __name__ == "__main__":
+    # --- EXECUTION ---
+    Ns = [200, 400, 600, 800, 1000, 1200]
+    print("Starting Benchmark: Goldbach (Order) vs Random (Chaos)...")
+    goldbach_stability, random_stability = run_benchmark(Ns)
 
-# --- VISUALIZATION ---
-plt.figure(figsize=(10, 6))
-plt.plot(Ns, goldbach_stability, 'o-', label="Nedelchev Goldbach (λ=1)", linewidth=3, color='blue')
-plt.plot(Ns, random_stability, 'x--', label="Randomized Topology (λ->0)", color='red')
-plt.axhline(y=1.0, color='black', linestyle=':', alpha=0.5)
+    # --- VISUALIZATION ---
+    plt.figure(figsize=(10, 6))
+    plt.plot(Ns, goldbach_stability, 'o-', label="Nedelchev Goldbach (λ=1)", linewidth=3, color='blue')
+    plt.plot(Ns, random_stability, 'x--', label="Randomized Topology (λ->0)", color='red')
+    plt.axhline(y=1.0, color='black', linestyle=':', alpha=0.5)
 
-plt.title("Structural Uniqueness: Goldbach vs Chaos", fontsize=14)
-plt.xlabel("Scale (N)", fontsize=12)
-plt.ylabel("Spectral Radius (Stability Index)", fontsize=12)
-plt.legend()
-plt.grid(alpha=0.3)
-plt.show()
+    plt.title("Structural Uniqueness: Goldbach vs Chaos", fontsize=14)
+    plt.xlabel("Scale (N)", fontsize=12)
+    plt.ylabel("Spectral Radius (Stability Index)", fontsize=12)
+    plt.legend()
+    plt.grid(alpha=0.3)
+    plt.show()
 
-# Scientific Conclusion:
-# If Goldbach remains at 1.0 and Random drops to 0, the law is STRUCTURAL.
\ No newline at end of file
+    # Scientific Conclusion:
+    # If Goldbach remains at 1.0 and Random drops to 0, the law is STRUCTURAL.
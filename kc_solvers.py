@@ -0,0 +1,636 @@
+"""
+Drivers for critical-coupling searches across many scales N.
+
+find_kc (dynamical_scaling_v4.py) and find_critical_coupling_precise
+(nedelchev_law_validation.py) bisect one N at a time on one core. The sweep
+below farms each N out to a process pool, with one BLAS thread per worker
+and an independent, reproducible seed per N, and yields results in
+completion order.
+"""
+
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+
+import numpy as np
+from scipy.stats import t as student_t
+
+from goldbach_primes import get_primes, goldbach_gamma, goldbach_partners
+from kuramoto_integrators import order_parameter, pair_flow
+from kuramoto_kernels import partner_index
+
+_BLAS_ENV = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+             'BLIS_NUM_THREADS', 'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS')
+_thread_limits = None
+
+
+# ============================================================
+# PARALLEL SWEEP OVER N
+# ============================================================
+@contextmanager
+def _blas_env(n_threads):
+    """Set the BLAS thread variables while worker processes are started."""
+    saved = {var: os.environ.get(var) for var in _BLAS_ENV}
+    os.environ.update({var: str(n_threads) for var in _BLAS_ENV})
+    try:
+        yield
+    finally:
+        for var, value in saved.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+def _limit_blas_threads(n_threads):
+    """
+    Worker initializer. Environment variables only reach BLAS libraries
+    loaded after they are set (spawned workers); forked workers inherit an
+    already initialised BLAS, which threadpoolctl can limit if installed.
+    """
+    global _thread_limits
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return
+    _thread_limits = threadpool_limits(limits=n_threads)
+
+
+def _kc_task(find_kc, index, N, seed_seq, collect_log, kwargs):
+    """Worker: one bisection with the legacy global RNG seeded from seed_seq."""
+    np.random.seed(seed_seq.generate_state(4))
+    log = [] if collect_log else None
+    if collect_log:
+        kwargs = dict(kwargs, log=log)
+    start = time.perf_counter()
+    kc = find_kc(N, **kwargs)
+    return {'index': index, 'N': N, 'kc': kc, 'seed': seed_seq.entropy,
+            'spawn_key': seed_seq.spawn_key, 'elapsed': time.perf_counter() - start,
+            'log': log}
+
+
+def iter_kc_sweep(find_kc, N_values, seed=0, n_workers=None, blas_threads=1,
+                  collect_log=False, **kwargs):
+    """
+    Run find_kc(N, **kwargs) for every N, yielding results as they finish.
+
+    Parameters:
+    -----------
+    find_kc : callable
+        Module-level bisection function (it must be picklable by reference)
+    N_values : sequence of int
+        Scales to sweep
+    seed : int
+        Root seed; N_values[k] always uses child k of SeedSequence(seed),
+        so results do not depend on n_workers or completion order
+    n_workers : int, optional
+        Process pool size (defaults to os.cpu_count(); 1 runs in-process)
+    blas_threads : int
+        BLAS / OpenMP threads per worker
+    collect_log : bool
+        Pass a fresh list as find_kc(..., log=[]) and return it with the
+        result (a list given in kwargs would be filled in the worker only)
+    **kwargs
+        Passed on to find_kc
+
+    Yields:
+    -------
+    result : dict
+        'index' (position in N_values), 'N', 'kc', 'seed', 'spawn_key',
+        'elapsed' (seconds), 'log' (None unless collect_log)
+    """
+    seeds = np.random.SeedSequence(seed).spawn(len(N_values))
+    n_workers = n_workers or os.cpu_count() or 1
+
+    if n_workers == 1:
+        for k, (N, ss) in enumerate(zip(N_values, seeds)):
+            yield _kc_task(find_kc, k, N, ss, collect_log, kwargs)
+        return
+
+    # Workers are started on demand, so the variables stay set throughout
+    with _blas_env(blas_threads), \
+            ProcessPoolExecutor(max_workers=min(n_workers, len(N_values)),
+                                initializer=_limit_blas_threads,
+                                initargs=(blas_threads,)) as pool:
+        futures = [pool.submit(_kc_task, find_kc, k, N, ss, collect_log, kwargs)
+                   for k, (N, ss) in enumerate(zip(N_values, seeds))]
+        for fut in as_completed(futures):
+            yield fut.result()
+
+
+def kc_sweep(find_kc, N_values, seed=0, n_workers=None, blas_threads=1,
+             collect_log=False, callback=None, **kwargs):
+    """
+    Collect iter_kc_sweep into arrays ordered like N_values.
+
+    callback(result) is called as each N finishes, e.g. to print progress.
+
+    Returns:
+    --------
+    results : dict
+        'N' and 'kc' arrays, 'elapsed' per N, 'wall_time'
+    """
+    start = time.perf_counter()
+    kc = np.empty(len(N_values))
+    elapsed = np.empty(len(N_values))
+    for result in iter_kc_sweep(find_kc, N_values, seed=seed, n_workers=n_workers,
+                                blas_threads=blas_threads, collect_log=collect_log,
+                                **kwargs):
+        kc[result['index']] = result['kc']
+        elapsed[result['index']] = result['elapsed']
+        if callback is not None:
+            callback(result)
+    return {
+        'N': np.array(N_values),
+        'kc': kc,
+        'elapsed': elapsed,
+        'wall_time': time.perf_counter() - start,
+    }
+
+
+# ============================================================
+# CONTINUATION IN KAPPA (warm starts, hysteresis)
+# ============================================================
+def continuation_sweep(advance, kappas, theta0, warmup=None, backward=True, tol=None):
+    """
+    Sweep kappa starting every point from the final phases of its neighbour.
+
+    Only the first point pays the full transient (warmup); every further
+    kappa is a small perturbation of an already settled state, so a short
+    advance() suffices. The forward branch runs up through kappas, the
+    backward branch then comes back down from the last forward state; a
+    gap between the two branches is hysteresis.
+
+    Parameters:
+    -----------
+    advance : callable
+        advance(theta, kappa) -> phases after a short settling run
+    kappas : array-like
+        Increasing coupling strengths
+    theta0 : array
+        Initial phases for the first kappa
+    warmup : callable, optional
+        Same signature as advance, run once at kappas[0] (full transient)
+    backward : bool
+        Also run the decreasing branch
+    tol : float, optional
+        |R_forward - R_backward| above which a kappa counts as hysteretic;
+        defaults to 3 / sqrt(M), above the finite-size fluctuations of R
+
+    Returns:
+    --------
+    results : dict
+        'kappas', 'R_forward', 'R_backward' (None without backward), 'gap',
+        'max_gap', 'hysteresis_range' ((kappa_min, kappa_max) or None)
+    """
+    kappas = np.asarray(kappas, dtype=float)
+    theta = np.array(theta0, dtype=float)
+    if warmup is not None:
+        theta = warmup(theta, kappas[0])
+
+    R_forward = np.empty(len(kappas))
+    for k, kappa in enumerate(kappas):
+        theta = advance(theta, kappa)
+        R_forward[k] = order_parameter(theta)
+
+    results = {'kappas': kappas, 'R_forward': R_forward, 'R_backward': None,
+               'gap': None, 'max_gap': None, 'hysteresis_range': None}
+    if not backward:
+        return results
+
+    R_backward = np.empty(len(kappas))
+    for k in range(len(kappas) - 1, -1, -1):
+        theta = advance(theta, kappas[k])
+        R_backward[k] = order_parameter(theta)
+
+    if tol is None:
+        tol = 3.0 / np.sqrt(theta.shape[-1])
+    gap = R_backward - R_forward
+    hysteretic = np.abs(gap) > tol
+    results.update({
+        'R_backward': R_backward,
+        'gap': gap,
+        'max_gap': float(np.max(np.abs(gap))),
+        'hysteresis_range': ((float(kappas[hysteretic].min()), float(kappas[hysteretic].max()))
+                             if np.any(hysteretic) else None),
+    })
+    return results
+
+
+def warm_start_bisection(advance, low, high, theta0, threshold=0.5, n_iter=10,
+                         warmup=None, branch='forward'):
+    """
+    Bisection for kappa_c where each midpoint starts from a settled bracket state.
+
+    branch='forward' starts every midpoint from the phases of the current
+    lower (incoherent) end, i.e. it finds where the incoherent state loses
+    stability as kappa increases; branch='backward' starts from the upper
+    (locked) end and finds where locking is lost as kappa decreases. The
+    two estimates differ by the width of the hysteresis loop. Both ends are
+    settled first; unless R(low) <= threshold < R(high) the crossing is not
+    bracketed, no midpoint is run and kappa_c is NaN.
+
+    Returns:
+    --------
+    results : dict
+        'kappa_c', 'low', 'high', 'R_low', 'R_high', 'bracketed'
+    """
+    if branch not in ('forward', 'backward'):
+        raise ValueError(f"Unknown branch '{branch}', expected 'forward' or 'backward'")
+    first = warmup if warmup is not None else advance
+    theta_low = first(np.array(theta0, dtype=float), low)
+    theta_high = first(np.array(theta0, dtype=float), high)
+    R_low, R_high = order_parameter(theta_low), order_parameter(theta_high)
+    if not R_low <= threshold < R_high:
+        return {'kappa_c': np.nan, 'low': low, 'high': high,
+                'R_low': float(R_low), 'R_high': float(R_high), 'bracketed': False}
+
+    for _ in range(n_iter):
+        mid = (low + high) / 2
+        start = theta_low if branch == 'forward' else theta_high
+        theta = advance(start.copy(), mid)
+        R = order_parameter(theta)
+        if R > threshold:
+            high, theta_high, R_high = mid, theta, R
+        else:
+            low, theta_low, R_low = mid, theta, R
+
+    return {'kappa_c': (low + high) / 2, 'low': low, 'high': high,
+            'R_low': float(R_low), 'R_high': float(R_high), 'bracketed': True}
+
+
+# ============================================================
+# LOCKSTEP BISECTION (all N in one padded batch)
+# ============================================================
+class PaddedGoldbachBatch:
+    """
+    Goldbach-coupled oscillators of several N packed into one padded state.
+
+    Row n of the (num_N, M_max) arrays holds the primes below N_values[n]
+    (natural frequencies omega = primes, as in find_kc). Padding slots are
+    masked out of R and point to themselves in the partner index, so they
+    neither couple nor are coupled. idx holds flat indices into the
+    raveled state, which lets one pair_flow call advance every row.
+    """
+
+    def __init__(self, N_values):
+        self.N_values = np.asarray(N_values)
+        primes = [get_primes(N) for N in self.N_values]
+        self.M = np.array([len(p) for p in primes])
+        self.shape = (len(primes), int(self.M.max()))
+
+        self.omega = np.zeros(self.shape)
+        self.mask = np.zeros(self.shape, dtype=bool)
+        self.idx = np.arange(self.shape[0] * self.shape[1]).reshape(self.shape)
+        for n, (N, p) in enumerate(zip(self.N_values, primes)):
+            self.omega[n, :len(p)] = p
+            self.mask[n, :len(p)] = True
+            self.idx[n, :len(p)] += partner_index(goldbach_partners(N, p)) - np.arange(len(p))
+
+    def random_phases(self, rng):
+        return rng.uniform(0, 2 * np.pi, self.shape)
+
+    def evolve(self, theta0, K, duration):
+        """
+        Advance every row by duration under goldbach_rhs with its own K.
+
+        Uses the exact pair flow (kuramoto_integrators.pair_flow), so all
+        rows move together without sharing an adaptive step size.
+        """
+        k = np.repeat(-np.asarray(K, dtype=float) / self.M, self.shape[1])
+        theta = pair_flow(theta0.ravel(), self.omega.ravel(), self.idx.ravel(), k, duration)
+        return theta.reshape(self.shape)
+
+    def order_parameters(self, theta):
+        """R of every row over its unpadded oscillators."""
+        z = np.where(self.mask, np.exp(1j * theta), 0.0).sum(axis=1)
+        return np.abs(z) / self.M
+
+
+def lockstep_bisection(evaluate, low, high, threshold=0.5, n_iter=10):
+    """
+    Bisect many independent brackets together.
+
+    evaluate(kappas) returns R for every bracket at once (one batched
+    simulation), so the whole search costs n_iter evaluations regardless
+    of the number of brackets. A bracket counts as bracketed only if both of
+    its ends moved, i.e. some midpoint was above and some below the
+    threshold; otherwise the crossing may lie outside [low, high] (e.g. R
+    stays below the threshold everywhere) and its kappa_c is NaN.
+
+    Returns:
+    --------
+    results : dict
+        'kappa_c' (NaN where not bracketed), 'low', 'high', 'bracketed'
+        arrays and 'n_evaluations'
+    """
+    low = np.array(low, dtype=float)
+    high = np.array(high, dtype=float)
+    seen_above = np.zeros(low.shape, dtype=bool)
+    seen_below = np.zeros(low.shape, dtype=bool)
+    for _ in range(n_iter):
+        mid = (low + high) / 2
+        above = np.asarray(evaluate(mid)) > threshold
+        seen_above |= above
+        seen_below |= ~above
+        high = np.where(above, mid, high)
+        low = np.where(above, low, mid)
+    bracketed = seen_above & seen_below
+    return {'kappa_c': np.where(bracketed, (low + high) / 2, np.nan), 'low': low, 'high': high,
+            'bracketed': bracketed, 'n_evaluations': n_iter}
+
+
+def goldbach_kc_lockstep(N_values, n_iter=10, duration=20, threshold=0.5, seed=None):
+    """
+    find_kc for every N at once: brackets [0, 2.5 N], fresh random phases
+    for every round, R measured after duration.
+    """
+    batch = PaddedGoldbachBatch(N_values)
+    rng = np.random.default_rng(seed)
+
+    def evaluate(K):
+        theta = batch.evolve(batch.random_phases(rng), K, duration)
+        return batch.order_parameters(theta)
+
+    return lockstep_bisection(evaluate, np.zeros(len(N_values)), 2.5 * batch.N_values,
+                              threshold=threshold, n_iter=n_iter)
+
+
+# ============================================================
+# MODEL-GUIDED BRACKETS AND ILLINOIS ROOT FINDING
+# ============================================================
+def kappa_c_empirical(N, gamma=None):
+    """
+    Equation (2) prediction A * N^B / Gamma(N), with A and B from
+    nedelchev_complete_model.py and Gamma(N) from goldbach_primes.
+    """
+    # Imported here so that kc_solvers does not load matplotlib (pulled in by
+    # nedelchev_complete_model) for the sweeps
+    from nedelchev_complete_model import kappa_c_empirical as equation_2
+
+    if gamma is None:
+        gamma = goldbach_gamma(N)
+    return equation_2(N, gamma_val=gamma)
+
+
+def validation_fit(path=None):
+    """Slope and intercept of the logged fit kappa_c = alpha * N + beta."""
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'validation_results.txt')
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    alpha = float(re.search(r'Slope \(α\):\s*([-\d.]+)', text).group(1))
+    beta = float(re.search(r'Intercept \(β\):\s*([-\d.]+)', text).group(1))
+    return alpha, beta
+
+
+def frequency_spread_bounds(omega, idx, scale):
+    """
+    Coupling window in which Goldbach pairs can start to lock.
+
+    A pair with pair coupling g = K / scale locks iff 2 g >= |omega_p - omega_q|,
+    so no pair is locked below scale * min|dw| / 2 and all are above
+    scale * max|dw| / 2 (scale = M for goldbach_rhs, avg_degree for
+    PrimeSynchronization). Returns (0, 0) without pairs.
+    """
+    omega = np.asarray(omega, dtype=float)
+    paired = idx != np.arange(len(idx))
+    if not np.any(paired):
+        return 0.0, 0.0
+    dw = np.abs(omega[paired] - omega[idx[paired]])
+    return scale * dw.min() / 2, scale * dw.max() / 2
+
+
+def illinois_kc(evaluate, guess, lower=0.0, upper=np.inf, threshold=0.5, tol=1.0,
+                rel_step=0.25, max_evals=40):
+    """
+    Root of R(kappa) - threshold from a model guess, by bracketing + Illinois.
+
+    The bracket is grown geometrically from guess (steps of rel_step * guess,
+    doubling) in the direction indicated by the sign of R(guess) - threshold,
+    never beyond [lower, upper]. Inside a bracket, regula falsi with the
+    Illinois modification (halving the stale end's value when the same end
+    is kept twice) shrinks it until it is narrower than tol. Trial points
+    are kept at least 5% of the bracket away from its ends, so a step-like
+    R(kappa) degrades gracefully to bisection.
+
+    Returns:
+    --------
+    results : dict
+        'kappa_c', 'low', 'high', 'n_evaluations', 'converged' (False when
+        no sign change was found within [lower, upper]; kappa_c is then
+        that bound), 'history' of (kappa, R)
+    """
+    history = []
+
+    def f(kappa):
+        R = float(evaluate(kappa))
+        history.append((kappa, R))
+        return R - threshold
+
+    def result(low, high, converged):
+        return {'kappa_c': (low + high) / 2, 'low': low, 'high': high,
+                'n_evaluations': len(history), 'converged': converged,
+                'history': history}
+
+    guess = float(np.clip(guess, lower, upper))
+    f_guess = f(guess)
+    step = rel_step * max(abs(guess), tol)
+    # Synchronized at the guess -> kappa_c lies below it, and vice versa
+    direction = -1.0 if f_guess > 0 else 1.0
+    a, fa = guess, f_guess
+    while True:
+        edge = lower if direction < 0 else upper
+        b = float(np.clip(a + direction * step, lower, upper))
+        if b == a or len(history) >= max_evals:
+            return result(edge, edge, False)
+        fb = f(b)
+        if (fb > 0) != (fa > 0):
+            break
+        a, fa = b, fb
+        step *= 2
+
+    low, f_low, high, f_high = (a, fa, b, fb) if a < b else (b, fb, a, fa)
+    kept = 0
+    while high - low > tol and len(history) < max_evals:
+        x = high - f_high * (high - low) / (f_high - f_low)
+        margin = 0.05 * (high - low)
+        x = min(max(x, low + margin), high - margin)
+        fx = f(x)
+        if (fx > 0) == (f_high > 0):
+            high, f_high = x, fx
+            if kept == -1:
+                f_low /= 2
+            kept = -1
+        else:
+            low, f_low = x, fx
+            if kept == 1:
+                f_high /= 2
+            kept = 1
+    return result(low, high, high - low <= tol)
+
+
+def newton_kc(evaluate, guess, lower=0.0, upper=np.inf, threshold=0.5, tol=1.0,
+              rel_step=0.25, max_evals=12):
+    """
+    Safeguarded Newton iteration on R(kappa) - threshold.
+
+    evaluate(kappa) returns (R, dR/dkappa), e.g. from a run that carries the
+    forward sensitivities. Every evaluation also tightens a bracket: kappa
+    is an upper end when R > threshold and a lower end otherwise. A Newton
+    step is taken when the slope is positive and the step lands strictly
+    inside the current bracket. Otherwise the iteration bisects a closed
+    bracket, or steps geometrically (rel_step * kappa, doubling) towards the
+    missing end.
+
+    Returns:
+    --------
+    results : dict
+        'kappa_c', 'low', 'high', 'n_evaluations', 'converged' (Newton step
+        or bracket below tol), 'history' of (kappa, R, dR/dkappa)
+    """
+    history = []
+    low, high = float(lower), float(upper)
+    have_low = have_high = False
+    step = rel_step * max(abs(guess), tol)
+    x = float(np.clip(guess, lower, upper))
+
+    while len(history) < max_evals:
+        R, dR = evaluate(x)
+        R, dR = float(R), float(dR)
+        history.append((x, R, dR))
+        f = R - threshold
+        if f > 0:
+            high, have_high = x, True
+        else:
+            low, have_low = x, True
+        if have_low and have_high and high - low <= tol:
+            return {'kappa_c': (low + high) / 2, 'low': low, 'high': high,
+                    'n_evaluations': len(history), 'converged': True,
+                    'history': history}
+
+        x_new = x - f / dR if dR > 0 else np.nan
+        if low < x_new < high:
+            if abs(x_new - x) < tol / 2:
+                return {'kappa_c': x_new, 'low': low, 'high': high,
+                        'n_evaluations': len(history), 'converged': True,
+                        'history': history}
+        elif have_low and have_high:
+            x_new = (low + high) / 2
+        else:
+            # Still unbracketed on one side: walk towards it
+            x_new = float(np.clip(x + (step if f <= 0 else -step), lower, upper))
+            step *= 2
+            if x_new == x:
+                break
+        x = x_new
+
+    edge = low if have_high else high
+    return {'kappa_c': (low + high) / 2 if have_low and have_high else edge,
+            'low': low, 'high': high, 'n_evaluations': len(history),
+            'converged': False, 'history': history}
+
+
+# ============================================================
+# STATISTICAL BISECTION (common random numbers, sequential test)
+# ============================================================
+def statistical_bisection(evaluate, low, high, threshold=0.5, confidence=0.95, tol=1.0,
+                          n_iter=10, batch_size=8, max_seeds=64):
+    """
+    Bisection on the seed-averaged R(kappa) with a sequential test per step.
+
+    evaluate(kappa, seeds) returns R for the given seed indices as one
+    batched simulation. Seed s always starts from the same initial phases
+    (common random numbers), so differences between kappas are not masked
+    by the draw of initial conditions. At each midpoint seeds are added
+    batch_size at a time until mean R is above or below threshold by
+    t * standard error, or max_seeds is reached.
+
+    Both ends are tested first with the same sequential test; unless low
+    is significantly below and high significantly above the threshold the
+    crossing is not bracketed, and kappa_c is NaN with resolved=False.
+    The error budget 1 - confidence is split evenly over all possible looks
+    (the two ends and n_iter steps, max_seeds / batch_size looks each), so
+    with at least that probability every decision is right and the mean-R
+    crossing lies in the final [low, high]. A midpoint that stays undecided
+    is statistically indistinguishable from kappa_c: the search stops
+    there and reports the bracket around it.
+
+    Returns:
+    --------
+    results : dict
+        'kappa_c', 'low', 'high' (confidence interval), 'confidence',
+        'bracketed' (both ends decided on opposite sides), 'resolved'
+        (False when not bracketed or stopped at an undecided midpoint),
+        'n_simulations' (single-seed runs), 'n_batches', 'history' of
+        (kappa, mean R, standard error, seeds used, decision)
+    """
+    low, high = float(low), float(high)
+    n_looks = max(max_seeds // batch_size, 1)
+    alpha = (1 - confidence) / ((n_iter + 2) * n_looks)
+    history = []
+    n_batches = 0
+
+    def decide(kappa):
+        nonlocal n_batches
+        R = np.empty(0)
+        decision = None
+        while decision is None:
+            seeds = np.arange(len(R), len(R) + batch_size)
+            R = np.concatenate([R, np.asarray(evaluate(kappa, seeds), dtype=float)])
+            n_batches += 1
+            mean = R.mean()
+            se = R.std(ddof=1) / np.sqrt(len(R))
+            margin = student_t.ppf(1 - alpha / 2, len(R) - 1) * se
+            if mean - margin > threshold:
+                decision = 'above'
+            elif mean + margin < threshold:
+                decision = 'below'
+            elif len(R) + batch_size > max_seeds:
+                decision = 'undecided'
+        history.append((kappa, mean, se, len(R), decision))
+        return decision
+
+    def result(kappa_c, bracketed, resolved):
+        return {'kappa_c': kappa_c, 'low': low, 'high': high,
+                'confidence': confidence, 'bracketed': bracketed, 'resolved': resolved,
+                'n_simulations': n_batches * batch_size, 'n_batches': n_batches,
+                'history': history}
+
+    if decide(low) != 'below' or decide(high) != 'above':
+        return result(np.nan, False, False)
+
+    for _ in range(n_iter):
+        if high - low <= tol:
+            break
+        mid = (low + high) / 2
+        decision = decide(mid)
+        if decision == 'undecided':
+            return result((low + high) / 2, True, False)
+        if decision == 'above':
+            high = mid
+        else:
+            low = mid
+
+    return result((low + high) / 2, True, True)
+
+
+def goldbach_kc_statistical(N, confidence=0.95, tol=1.0, n_iter=10, duration=20,
+                            threshold=0.5, batch_size=8, max_seeds=64, seed=0):
+    """
+    find_kc for one N with statistical_bisection: bracket [0, 2.5 N],
+    batch_size seeds advanced together as rows of a PaddedGoldbachBatch,
+    initial phases for seed s fixed by (seed, s) for every K.
+    """
+    batch = PaddedGoldbachBatch([N] * batch_size)
+    theta0 = np.random.default_rng(seed).uniform(0, 2 * np.pi, (max_seeds, batch.shape[1]))
+
+    def evaluate(K, seeds):
+        theta = batch.evolve(theta0[seeds], np.full(batch_size, K), duration)
+        return batch.order_parameters(theta)
+
+    return statistical_bisection(evaluate, 0.0, 2.5 * N, threshold=threshold,
+                                 confidence=confidence, tol=tol, n_iter=n_iter,
+                                 batch_size=batch_size, max_seeds=max_seeds)
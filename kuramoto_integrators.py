@@ -0,0 +1,362 @@
+"""
+Integrators for ensembles of prime-oscillator Kuramoto systems.
+
+The coupling kernels in kuramoto_kernels.py work on (K, M) batches, so K
+coupling strengths and/or initial conditions can be advanced by a single
+vectorized step instead of K separate Python-level simulations.
+"""
+
+import numpy as np
+
+
+def order_parameter(theta):
+    """Kuramoto order parameter R = |<exp(i*theta)>| along the last axis."""
+    return np.abs(np.mean(np.exp(1j * theta), axis=-1))
+
+
+def integrate_ensemble(omega, kappas, theta0, dt, steps, interaction):
+    """
+    Fixed-step Euler integration of a whole ensemble at once.
+
+    Every member k follows theta' = omega + kappas[k] * interaction(theta),
+    so interaction(theta) is the model's coupling term per unit kappa,
+    evaluated on the full (K, M) state.
+
+    Parameters:
+    -----------
+    omega : array, shape (M,) or (K, M)
+        Natural frequencies
+    kappas : array, shape (K,)
+        Coupling strength of each ensemble member
+    theta0 : array, shape (M,) or (K, M)
+        Initial phases (a single (M,) vector is shared by all members)
+    dt : float
+        Time step
+    steps : int
+        Number of steps
+    interaction : callable
+        (K, M) -> (K, M) coupling term per unit coupling strength
+
+    Returns:
+    --------
+    theta : ndarray, shape (K, M)
+        Final phases of every ensemble member
+    """
+    kappas = np.asarray(kappas, dtype=float)[:, None]
+    theta = np.array(np.broadcast_to(theta0, (len(kappas), np.shape(theta0)[-1])),
+                     dtype=float)
+    for _ in range(steps):
+        theta += (omega + kappas * interaction(theta)) * dt
+    return theta
+
+
+class EulerWorkspace:
+    """
+    Allocation-free explicit Euler steps for pair plus mean-field coupling:
+
+        theta' = omega + k_pair * sin(theta[idx] - theta)
+                       + k_mean * R * sin(psi - theta)
+
+    All buffers are allocated once; step() runs entirely on out= ufuncs
+    and in-place updates. The mean-field term uses
+    R * sin(psi - theta_i) = <sin> cos(theta_i) - <cos> sin(theta_i),
+    so no complex exp(1j * theta) vector is formed.
+
+    With dtype=np.float32 the phases are reduced modulo 2*pi after every
+    step (wrap=True by default), since unbounded float32 phases of
+    prime-frequency oscillators lose their precision within a few steps.
+    """
+
+    def __init__(self, omega, idx, k_pair, k_mean, dt, dtype=np.float64, wrap=None):
+        self.dtype = np.dtype(dtype)
+        self.dt = dt
+        self.M = len(omega)
+        self.idx = np.asarray(idx, dtype=np.intp)
+        self.omega_dt = (np.asarray(omega, dtype=float) * dt).astype(self.dtype)
+        self.k_pair_dt = float(k_pair * dt)
+        self.k_mean_dt = float(k_mean * dt)
+        self.wrap = (self.dtype == np.float32) if wrap is None else wrap
+        self._cos = np.empty(self.M, dtype=self.dtype)
+        self._sin = np.empty(self.M, dtype=self.dtype)
+        self._pair = np.empty(self.M, dtype=self.dtype)
+        self._force = np.empty(self.M, dtype=self.dtype)
+        self._C = np.zeros((), dtype=self.dtype)
+        self._S = np.zeros((), dtype=self.dtype)
+
+    def phases(self, theta):
+        """Copy of theta in the workspace dtype (the array step() updates)."""
+        return np.array(theta, dtype=self.dtype)
+
+    def step(self, theta):
+        """Advance theta in place by one step; returns R before the step."""
+        np.cos(theta, out=self._cos)
+        np.sin(theta, out=self._sin)
+        np.add.reduce(self._cos, out=self._C)
+        np.add.reduce(self._sin, out=self._S)
+        C = float(self._C) / self.M
+        S = float(self._S) / self.M
+
+        # Pair term k_pair * sin(theta[idx] - theta); mode='clip' avoids the
+        # bounds-check copy that take() makes of out= in its default mode
+        theta.take(self.idx, out=self._pair, mode='clip')
+        np.subtract(self._pair, theta, out=self._pair)
+        np.sin(self._pair, out=self._pair)
+        np.multiply(self._pair, self.k_pair_dt, out=self._pair)
+
+        # Mean-field term k_mean * (<sin> cos(theta) - <cos> sin(theta))
+        np.multiply(self._cos, self.k_mean_dt * S, out=self._force)
+        np.multiply(self._sin, self.k_mean_dt * C, out=self._sin)
+        np.subtract(self._force, self._sin, out=self._force)
+
+        np.add(theta, self.omega_dt, out=theta)
+        np.add(theta, self._pair, out=theta)
+        np.add(theta, self._force, out=theta)
+        if self.wrap:
+            np.remainder(theta, 2 * np.pi, out=theta)
+        return (C * C + S * S) ** 0.5
+
+
+def _adler_flow(psi0, delta, c, t):
+    """
+    Exact solution of the Adler equation psi' = delta - c * sin(psi).
+
+    Drifting pairs (|delta| > |c|) use the closed form
+    tan(psi/2) = (c + Omega * tan(tau)) / delta, tau = tau0 + Omega * t / 2,
+    unwrapped branch by branch. Locking pairs use the Moebius (Riccati)
+    flow of z = exp(i*psi), with the unwrapped value chosen between psi0 and
+    the stable fixed point it is moving towards.
+    """
+    psi0, delta, c = np.broadcast_arrays(psi0, delta, c)
+    psi = np.array(psi0, dtype=float)
+    two_pi = 2 * np.pi
+
+    # --- Uncoupled: pure rotation
+    free = c == 0
+    psi[free] = psi0[free] + delta[free] * t
+
+    # --- Drifting: |delta| > |c|
+    drift = ~free & (np.abs(delta) > np.abs(c))
+    if np.any(drift):
+        d, cc, p0 = delta[drift], c[drift], psi0[drift]
+        sgn = np.sign(d)
+        Om = np.sqrt(d * d - cc * cc)
+        half = 0.5 * p0
+        n0 = sgn * np.floor((half + 0.5 * np.pi) / np.pi)
+        B = half - sgn * np.pi * n0
+        tau = np.arctan((d * np.tan(B) - cc) / Om) + n0 * np.pi + 0.5 * Om * t
+        n = np.floor((tau + 0.5 * np.pi) / np.pi)
+        psi[drift] = 2 * (np.arctan((cc + Om * np.tan(tau - n * np.pi)) / d) + sgn * np.pi * n)
+
+    # --- Locking: |delta| <= |c|, c != 0
+    lock = ~free & ~drift
+    if np.any(lock):
+        d, cc, p0 = delta[lock], c[lock], psi0[lock]
+        lam = 0.5 * np.sqrt(cc * cc - d * d)
+        g = np.where(lam > 0, np.tanh(lam * t) / np.where(lam > 0, lam, 1.0), t)
+        z0 = np.exp(1j * p0)
+        z = ((1 + 0.5j * g * d) * z0 + 0.5 * g * cc) / (0.5 * g * cc * z0 + 1 - 0.5j * g * d)
+        psi_mod = np.angle(z)
+
+        sgn = np.sign(d - cc * np.sin(p0))
+        r1 = np.arcsin(np.clip(d / cc, -1.0, 1.0))
+        dist = np.minimum(np.mod(sgn * (r1 - p0), two_pi), np.mod(sgn * (np.pi - r1 - p0), two_pi))
+        target = p0 + sgn * dist
+        rep = p0 + sgn * np.mod(sgn * (psi_mod - p0), two_pi)
+        beyond = sgn * (rep - target)
+        before = two_pi - sgn * (rep - p0)
+        rep = np.where((beyond > 0) & (before < beyond), rep - sgn * two_pi, rep)
+        psi[lock] = np.where(sgn == 0, p0, rep)
+
+    return psi
+
+
+def pair_flow(theta, omega, idx, k, t):
+    """
+    Exact flow over time t of theta' = omega + k * sin(theta[idx] - theta).
+
+    For a partial permutation idx the system splits into independent pairs
+    (unpaired oscillators point to themselves and rotate freely). Each pair
+    has a mean phase rotating exactly at (omega_p + omega_q) / 2 and a
+    relative phase obeying the Adler equation, which is solved in closed
+    form. goldbach_rhs corresponds to k = -K/M.
+    """
+    theta = np.asarray(theta, dtype=float)
+    omega = np.asarray(omega, dtype=float)
+    paired = idx != np.arange(len(idx))
+    psi0 = theta - theta[..., idx]
+    mu = 0.5 * (theta + theta[..., idx]) + 0.5 * (omega + omega[idx]) * t
+    c = 2 * np.asarray(k, dtype=float) * paired
+    psi = _adler_flow(psi0, omega - omega[idx], c, t)
+    return mu + 0.5 * psi
+
+
+def rotating_frame_integrate(omega, idx, k, theta0, t_end, dt=None,
+                             extra=None, t0=0.0):
+    """
+    Exponential (splitting) integrator for prime-frequency oscillators.
+
+    The fast part of the dynamics - the linear omega term together with the
+    Goldbach pair coupling k * sin(theta[idx] - theta), whose beat
+    frequencies omega_p - omega_q are as large as the primes themselves - is
+    propagated exactly by pair_flow. Any additional coupling extra(theta, t)
+    (e.g. a mean-field term) is treated numerically with Strang splitting:
+    half a step of the exact flow, a Heun step of extra, half a step of the
+    exact flow. Without extra the result is exact for any step size.
+
+    Parameters:
+    -----------
+    omega : array, shape (M,)
+        Natural frequencies
+    idx : array of int, shape (M,)
+        Partner gather index (see kuramoto_kernels.partner_index)
+    k : float or array broadcastable to theta
+        Signed pair coupling coefficient (e.g. -K/M, or a (K, 1) column)
+    theta0 : array, shape (M,) or (K, M)
+        Initial phases
+    t_end : float
+        Final time
+    dt : float, optional
+        Splitting step (ignored when extra is None)
+    extra : callable, optional
+        extra(theta, t) -> additional coupling term
+    t0 : float
+        Initial time
+
+    Returns:
+    --------
+    theta : ndarray
+        Phases at t_end
+    n_evals : int
+        Number of extra(theta, t) evaluations
+    """
+    theta = np.array(theta0, dtype=float)
+    if extra is None:
+        return pair_flow(theta, omega, idx, k, t_end - t0), 0
+
+    n_steps = max(int(np.ceil((t_end - t0) / dt - 1e-12)), 1)
+    h = (t_end - t0) / n_steps
+    for n in range(n_steps):
+        t = t0 + n * h
+        theta = pair_flow(theta, omega, idx, k, 0.5 * h)
+        f0 = extra(theta, t + 0.5 * h)
+        f1 = extra(theta + h * f0, t + 0.5 * h)
+        theta = theta + 0.5 * h * (f0 + f1)
+        theta = pair_flow(theta, omega, idx, k, 0.5 * h)
+    return theta, 2 * n_steps
+
+
+# ============================================================
+# STOCHASTIC ENSEMBLES (one counter-based stream per member)
+# ============================================================
+def member_stream(seed, member):
+    """
+    Philox generator of ensemble member `member`.
+
+    Its key is child `member` of SeedSequence(seed), built directly from the
+    spawn key, so a member draws the same numbers in whichever process or
+    chunk it is simulated.
+    """
+    ss = np.random.SeedSequence(seed, spawn_key=(int(member),))
+    return np.random.Generator(np.random.Philox(ss))
+
+
+def euler_maruyama_ensemble(omega, kappas, dt, steps, interaction, sigma,
+                            seed=0, theta0=None, members=None):
+    """
+    Batched Euler-Maruyama for Kuramoto ensembles with additive phase noise:
+
+        dtheta_k = (omega + kappas[k] * interaction(theta_k)) dt + sigma dW_k
+
+    Parameters:
+    -----------
+    omega : array, shape (M,)
+        Natural frequencies
+    kappas : array, shape (K,)
+        Coupling strength of each member in this batch
+    dt : float
+        Time step
+    steps : int
+        Number of steps
+    interaction : callable
+        (K, M) -> (K, M) coupling per unit kappa, acting row by row
+    sigma : float
+        Noise amplitude (standard deviation of dW is sqrt(dt))
+    seed : int
+        Root seed of the ensemble
+    theta0 : array, shape (M,) or (K, M), optional
+        Initial phases; by default each member draws uniform phases from
+        its own stream
+    members : array of int, optional
+        Global member ids of the rows (defaults to 0..K-1); row k uses
+        member_stream(seed, members[k]) for everything it draws
+
+    Returns:
+    --------
+    theta : ndarray, shape (K, M)
+        Final phases
+    """
+    omega = np.asarray(omega, dtype=float)
+    kappas = np.asarray(kappas, dtype=float)[:, None]
+    M = len(omega)
+    if members is None:
+        members = np.arange(len(kappas))
+    streams = [member_stream(seed, m) for m in members]
+
+    if theta0 is None:
+        theta = np.stack([g.uniform(0, 2 * np.pi, M) for g in streams])
+    else:
+        theta = np.array(np.broadcast_to(theta0, (len(kappas), M)), dtype=float)
+
+    noise = np.empty_like(theta)
+    scale = sigma * np.sqrt(dt)
+    for _ in range(steps):
+        for g, row in zip(streams, noise):
+            g.standard_normal(out=row)
+        noise *= scale
+        theta += (omega + kappas * interaction(theta)) * dt
+        theta += noise
+    return theta
+
+
+def noisy_ensemble(omega, kappas, dt, steps, interaction, sigma, seed=0,
+                   theta0=None, n_workers=None, chunk_size=16):
+    """
+    euler_maruyama_ensemble split over a process pool.
+
+    Member k always uses member_stream(seed, k), so the result is identical
+    for any n_workers and chunk_size. interaction must be picklable (a
+    module-level function such as kuramoto_kernels.mean_field_coupling)
+    when n_workers > 1.
+
+    Returns:
+    --------
+    theta : ndarray, shape (K, M)
+        Final phases, in the order of kappas
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    kappas = np.asarray(kappas, dtype=float)
+    members = np.arange(len(kappas))
+    chunks = [members[i:i + chunk_size] for i in range(0, len(members), chunk_size)]
+    n_workers = n_workers or os.cpu_count() or 1
+    theta = np.empty((len(kappas), len(omega)))
+
+    def initial(chunk):
+        if theta0 is None or np.ndim(theta0) == 1:
+            return theta0
+        return np.asarray(theta0)[chunk]
+
+    if n_workers == 1:
+        for chunk in chunks:
+            theta[chunk] = euler_maruyama_ensemble(omega, kappas[chunk], dt, steps, interaction,
+                                                   sigma, seed, initial(chunk), chunk)
+        return theta
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = {pool.submit(euler_maruyama_ensemble, omega, kappas[chunk], dt, steps,
+                               interaction, sigma, seed, initial(chunk), chunk): chunk
+                   for chunk in chunks}
+        for fut in as_completed(futures):
+            theta[futures[fut]] = fut.result()
+    return theta
@@ -0,0 +1,134 @@
+"""
+Coupling kernels for the prime-oscillator Kuramoto models.
+
+The scripts in this repository evaluate the coupling term by forming the
+M x M matrix of phase differences on every step. Every kernel here returns
+the same quantity without that temporary:
+
+    coupling_i = sum_j W_ij * sin(theta_j - theta_i)
+
+For couplings that really are dense, dense_coupling does the same with two
+matrix-vector products instead. goldbach_sensitivity_rhs also carries
+d theta / dK, which order_parameter_sensitivity turns into dR/dK.
+
+Note the sign: several scripts use phases[:, None] - phases, i.e.
+sin(theta_i - theta_j) = -coupling_i. Callers keep their own sign so that
+results match the original dense code.
+"""
+
+import numpy as np
+
+
+def mean_field_coupling(theta):
+    """
+    All-to-all coupling (1/M) * sum_j sin(theta_j - theta_i), in O(M).
+
+    With the complex order parameter R*exp(i*psi) = mean(exp(i*theta)) this
+    is R*sin(psi - theta_i) = <sin> cos(theta_i) - <cos> sin(theta_i).
+    A (K, M) batch is handled row by row along the last axis.
+    """
+    s = np.sin(theta)
+    c = np.cos(theta)
+    return s.mean(axis=-1, keepdims=True) * c - c.mean(axis=-1, keepdims=True) * s
+
+
+def partner_index(partner):
+    """
+    Gather index for a partial permutation: unpaired rows (partner == -1)
+    point to themselves, so sin(theta[idx] - theta) is exactly 0 there.
+    """
+    partner = np.asarray(partner)
+    return np.where(partner >= 0, partner, np.arange(len(partner)))
+
+
+def partner_coupling(theta, idx, weight=1.0, out=None):
+    """
+    Goldbach coupling sum_j W_ij sin(theta_j - theta_i) in O(M).
+
+    W has at most one nonzero (= weight) per row, so the sum reduces to
+    weight * sin(theta[idx] - theta) with idx from partner_index().
+    No M x M temporaries are created; pass out= to reuse a buffer.
+    theta may be a (K, M) batch.
+    """
+    out = np.subtract(theta[..., idx], theta, out=out)
+    np.sin(out, out=out)
+    if weight != 1.0:
+        out *= weight
+    return out
+
+
+def goldbach_rhs(theta, t, omega, idx, K, M):
+    """
+    Drop-in odeint RHS for the Goldbach-coupled Kuramoto model.
+
+    Equals omega + (K/M) * sum_j W_ij sin(theta_i - theta_j), the
+    kuramoto_deriv of dynamical_scaling_v4.py, with W given by idx.
+    """
+    return omega - (K / M) * partner_coupling(theta, idx)
+
+
+def goldbach_rhs_ivp(t, theta, omega, idx, K, M):
+    """solve_ivp argument order (t, y) for goldbach_rhs."""
+    return goldbach_rhs(theta, t, omega, idx, K, M)
+
+
+def dense_coupling(theta, W):
+    """
+    Coupling sum_j W_ij sin(theta_j - theta_i) for a dense (or sparse) W.
+
+    With sin(theta_j - theta_i) = sin(theta_j) cos(theta_i) - cos(theta_j) sin(theta_i)
+    this is cos(theta) * (W @ sin(theta)) - sin(theta) * (W @ cos(theta)).
+    Both products are done as one BLAS call on the stacked [sin; cos]
+    block, so W is read once and no M x M temporaries are created.
+    theta may be a (K, M) batch (one (2K, M) x (M, M) product).
+    """
+    theta = np.asarray(theta, dtype=float)
+    rows = theta.reshape(-1, theta.shape[-1])
+    s = np.sin(rows)
+    c = np.cos(rows)
+    K = len(rows)
+    Y = np.concatenate([s, c]) @ W.T
+    out = c * Y[:K]
+    out -= s * Y[K:]
+    return out.reshape(theta.shape)
+
+
+def dense_rhs(theta, t, omega, W, K, M):
+    """
+    odeint RHS omega + (K/M) * sum_j W_ij sin(theta_i - theta_j) for any W
+    (random null models, weighted graphs), via dense_coupling.
+    """
+    return omega - (K / M) * dense_coupling(theta, W)
+
+
+def goldbach_sensitivity_rhs(y, t, omega, idx, K, M):
+    """
+    goldbach_rhs extended by the forward sensitivity s = d theta / dK.
+
+    y = [theta, s] of length 2M. Differentiating the RHS in K gives
+    ds/dt = -(1/M) sin(d) - (K/M) cos(d) * (s[idx] - s), d = theta[idx] - theta,
+    so the extra cost is one more gather, still O(M). Start from s = 0.
+    """
+    theta, s = y[:M], y[M:]
+    d = theta[idx] - theta
+    sin_d = np.sin(d)
+    out = np.empty_like(y)
+    out[:M] = omega - (K / M) * sin_d
+    out[M:] = -(sin_d + K * np.cos(d) * (s[idx] - s)) / M
+    return out
+
+
+def order_parameter_sensitivity(theta, s):
+    """
+    R = |mean exp(i theta)| and dR/dK from the phase sensitivities s.
+
+    With C + iS = mean exp(i theta): dC = -mean(sin(theta) s),
+    dS = mean(cos(theta) s) and dR = (C dC + S dS) / R.
+    """
+    c = np.cos(theta)
+    sn = np.sin(theta)
+    C, S = c.mean(), sn.mean()
+    R = np.hypot(C, S)
+    if R == 0:
+        return 0.0, 0.0
+    return R, (S * np.mean(c * s) - C * np.mean(sn * s)) / R
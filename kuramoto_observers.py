@@ -0,0 +1,438 @@
+"""
+Monitors that watch a running Kuramoto integration.
+
+The bisection drivers only need to know on which side of a threshold the
+order parameter settles, yet every run integrates to a fixed horizon. The
+steady-state monitor below lets an integration stop as soon as R(t) is
+clearly locked above, or clearly incoherent below, the threshold.
+
+The streaming observers summarise a run (tail-averaged R, effective
+frequencies, locked pairs) in O(M) memory; integrate_observed drives them
+from a scipy solver step by step without storing the trajectory. When the
+full trajectory is needed (phase heatmaps), TrajectoryRecorder writes
+decimated snapshots to a memory-mapped float32 file instead of RAM.
+"""
+
+import os
+import warnings
+
+import numpy as np
+from scipy.integrate import ODEintWarning, odeint
+
+
+class IntegrationFailure(RuntimeError):
+    """odeint gave up before the end of the grid (e.g. 'Excess work done')."""
+
+
+# LSODA step budget per output interval for the Goldbach models: with
+# omega up to N ~ 1000 and ~0.2 time units between samples the default
+# (500) runs out; 5000 leaves ample margin
+ODEINT_MXSTEP = 5000
+
+
+def checked_odeint(rhs, y0, t, args=(), **odeint_kwargs):
+    """
+    odeint that raises IntegrationFailure instead of returning the partial
+    (often zero-filled) solution LSODA leaves behind when it fails.
+    odeint_kwargs (e.g. mxstep) are passed on to odeint.
+    """
+    with warnings.catch_warnings():
+        # The failure is raised below; odeint's own warning would only repeat it
+        warnings.simplefilter('ignore', ODEintWarning)
+        sol, info = odeint(rhs, y0, t, args=args, full_output=True, **odeint_kwargs)
+    if info['message'] != 'Integration successful.':
+        raise IntegrationFailure(info['message'])
+    return sol
+
+
+class SteadyStateMonitor:
+    """
+    Windowed convergence test on R(t) and the phase-velocity spread.
+
+    Samples of R = |<exp(i*theta)>| and of std(dtheta/dt) are kept in two
+    consecutive windows. The state counts as settled when both windows have
+    statistically equal means (within z standard errors, and a relative
+    tolerance for the velocity spread). A settled state is reported as
+    'locked' when the newest window lies more than z standard deviations
+    above the threshold and 'incoherent' when it lies as far below it; in
+    both cases no sample of either window may be on the other side.
+    After a decision, stop_time and reason are set; finish() marks a run
+    that reached its horizon undecided with reason 'horizon'.
+    """
+
+    needs_velocity = True
+
+    def __init__(self, threshold=0.5, window=2.0, sample_dt=0.2, z=3.0,
+                 min_time=None, velocity_rtol=0.05):
+        self.threshold = threshold
+        self.sample_dt = sample_dt
+        self.z = z
+        self.n = max(int(round(window / sample_dt)), 2)
+        self.min_time = 2 * window if min_time is None else min_time
+        self.velocity_rtol = velocity_rtol
+        self.reset()
+
+    def reset(self):
+        self._R = np.zeros(2 * self.n)
+        self._v = np.zeros(2 * self.n)
+        self._count = 0
+        self._next_t = -np.inf
+        self.stop_time = None
+        self.reason = None
+        self.last_R = None
+
+    def _window(self, buf, newest):
+        """Samples of the older (newest=False) or newest window, any order."""
+        pos = self._count % (2 * self.n)
+        k = np.arange(self.n) + (pos + (self.n if newest else 0))
+        return buf[k % (2 * self.n)]
+
+    def update(self, t, theta, dtheta=None):
+        """Record one sample; returns True once a decision has been made."""
+        if self.reason is not None:
+            return True
+        if t < self._next_t:
+            return False
+        self._next_t = t + self.sample_dt - 1e-12
+
+        R = float(np.abs(np.mean(np.exp(1j * theta))))
+        self.last_R = R
+        slot = self._count % (2 * self.n)
+        self._R[slot] = R
+        self._v[slot] = np.std(dtheta) if dtheta is not None else 0.0
+        self._count += 1
+
+        if self._count < 2 * self.n or t < self.min_time:
+            return False
+
+        R_old, R_new = self._window(self._R, False), self._window(self._R, True)
+        v_old, v_new = self._window(self._v, False), self._window(self._v, True)
+        sem = np.sqrt((R_old.var() + R_new.var()) / self.n)
+        if abs(R_new.mean() - R_old.mean()) > self.z * sem + 1e-12:
+            return False
+        v_sem = np.sqrt((v_old.var() + v_new.var()) / self.n)
+        if abs(v_new.mean() - v_old.mean()) > self.z * v_sem + self.velocity_rtol * v_old.mean():
+            return False
+
+        spread = self.z * R_new.std()
+        R_all = self._R
+        if R_new.mean() - spread > self.threshold and R_all.min() > self.threshold:
+            self.reason = 'locked'
+        elif R_new.mean() + spread < self.threshold and R_all.max() < self.threshold:
+            self.reason = 'incoherent'
+        else:
+            return False
+        self.stop_time = t
+        return True
+
+    def finish(self, t):
+        """Close an undecided run at its horizon."""
+        if self.reason is None:
+            self.stop_time = t
+            self.reason = 'horizon'
+
+    def event(self, rhs):
+        """
+        Terminal solve_ivp event driven by this monitor.
+
+        rhs(t, y) supplies the phase velocities. The event stays positive
+        until a decision is made at stop_time and then equals
+        stop_time - t, so the integration ends exactly there.
+        """
+        def steady_state(t, y):
+            if self.reason is None:
+                self.update(t, y, rhs(t, y))
+            return 1.0 if self.reason is None else self.stop_time - t
+        steady_state.terminal = True
+        return steady_state
+
+
+def odeint_until_steady(rhs, theta0, t, args, monitor, chunk=10, **odeint_kwargs):
+    """
+    odeint over the sample grid t, stopping early once monitor decides.
+
+    The grid is integrated chunk samples at a time so that the loop can
+    break as soon as the monitor reaches a decision. odeint_kwargs are
+    passed on to checked_odeint.
+
+    Raises IntegrationFailure if odeint fails on a chunk; the monitor then
+    has reason 'failed' and stop_time at the start of that chunk, and no
+    decision is made from the unreliable state.
+
+    Returns:
+    --------
+    theta : ndarray
+        Phases at the stopping time
+    monitor : SteadyStateMonitor
+        With stop_time and reason set
+    """
+    theta = np.asarray(theta0, dtype=float)
+    for start in range(0, len(t) - 1, chunk):
+        seg = t[start:start + chunk + 1]
+        try:
+            sol = checked_odeint(rhs, theta, seg, args, **odeint_kwargs)
+        except IntegrationFailure:
+            monitor.stop_time = seg[0]
+            monitor.reason = 'failed'
+            raise
+        for tk, th in zip(seg[1:], sol[1:]):
+            theta = th
+            if monitor.update(tk, th, rhs(th, tk, *args)):
+                return theta, monitor
+    monitor.finish(t[-1])
+    return theta, monitor
+
+
+# ============================================================
+# STREAMING OBSERVERS (O(M) per update, no trajectory kept)
+# ============================================================
+class TailOrderParameter:
+    """
+    Time average of R(t) over [t_start, t_end] (trapezoid rule on solver
+    steps). The step straddling t_start is clipped there, with R
+    interpolated linearly at t_start.
+    """
+
+    def __init__(self, t_start=0.0):
+        self.t_start = t_start
+        self._t = None
+        self._R = None
+        self._area = 0.0
+        self._span = 0.0
+
+    def update(self, t, theta):
+        R = float(np.abs(np.mean(np.exp(1j * theta))))
+        if self._t is not None and t > self.t_start:
+            t_prev, R_prev = self._t, self._R
+            if t_prev < self.t_start:
+                R_prev += (R - R_prev) * (self.t_start - t_prev) / (t - t_prev)
+                t_prev = self.t_start
+            dt = t - t_prev
+            self._area += 0.5 * (R_prev + R) * dt
+            self._span += dt
+        self._t, self._R = t, R
+
+    def result(self):
+        return self._area / self._span if self._span > 0 else self._R
+
+
+class EffectiveFrequencies:
+    """
+    Mean phase velocity of every oscillator over t >= t_start.
+
+    The integrated phases are unbounded, so the velocity is the phase
+    advance divided by the elapsed time. Set wrapped=True for phases
+    reduced modulo 2*pi; they are then unwrapped step by step, which
+    requires each step to advance every phase by less than pi.
+    """
+
+    def __init__(self, t_start=0.0, wrapped=False):
+        self.t_start = t_start
+        self.wrapped = wrapped
+        self._t0 = None
+        self._t = None
+        self._start = None
+        self._prev = None
+        self._advance = None
+
+    def update(self, t, theta):
+        if t < self.t_start:
+            return
+        if self._t0 is None:
+            self._t0 = t
+            self._start = np.array(theta, dtype=float)
+            self._prev = self._start.copy()
+            self._advance = np.zeros_like(self._start)
+        elif self.wrapped:
+            step = np.subtract(theta, self._prev)
+            self._advance += np.mod(step + np.pi, 2 * np.pi) - np.pi
+            self._prev[:] = theta
+        else:
+            np.subtract(theta, self._start, out=self._advance)
+        self._t = t
+
+    def result(self):
+        if self._t0 is None or self._t == self._t0:
+            return None
+        return self._advance / (self._t - self._t0)
+
+
+class LockedPairs:
+    """
+    Number of Goldbach pairs whose effective frequencies agree within tol.
+
+    idx is the partner gather index (kuramoto_kernels.partner_index); a
+    pair (i, idx[i]) counts once, unpaired oscillators never count.
+    """
+
+    def __init__(self, idx, t_start=0.0, tol=1e-2, wrapped=False):
+        self.idx = np.asarray(idx)
+        self.tol = tol
+        self.frequencies = EffectiveFrequencies(t_start, wrapped)
+        self._first = self.idx > np.arange(len(self.idx))
+
+    def update(self, t, theta):
+        self.frequencies.update(t, theta)
+
+    def locked(self):
+        """Boolean mask over the first member i < idx[i] of every pair."""
+        omega = self.frequencies.result()
+        if omega is None:
+            return np.zeros(len(self.idx), dtype=bool)
+        return self._first & (np.abs(omega - omega[self.idx]) < self.tol)
+
+    def result(self):
+        return int(np.count_nonzero(self.locked()))
+
+
+def integrate_observed(fun, t_span, y0, observers=(), method='RK45', **options):
+    """
+    Integrate dy/dt = fun(t, y) feeding every accepted step to observers.
+
+    Only the current state is kept, so memory is O(M) however long the run.
+    Each observer has update(t, y); a True return value (e.g. from a
+    SteadyStateMonitor, which is also given fun(t, y) when it asks for
+    velocities) ends the integration. Observers with update_dense(t_old,
+    t, dense_output) receive the step interpolant instead (see
+    TrajectoryRecorder).
+
+    Returns:
+    --------
+    results : dict
+        't' (final time), 'theta' (final state), 'n_steps', 'status'
+        ('finished', 'stopped' or the solver failure message)
+    """
+    import scipy.integrate
+
+    solver = getattr(scipy.integrate, method)(fun, t_span[0], np.array(y0, dtype=float), t_span[1], **options)
+    observers = list(observers)
+
+    def feed(t, y, t_old=None):
+        stop = False
+        for obs in observers:
+            if t_old is not None and hasattr(obs, 'update_dense'):
+                obs.update_dense(t_old, t, solver.dense_output)
+            elif getattr(obs, 'needs_velocity', False):
+                stop |= bool(obs.update(t, y, fun(t, y)))
+            else:
+                stop |= bool(obs.update(t, y))
+        return stop
+
+    status = 'stopped' if feed(solver.t, solver.y) else None
+    n_steps = 0
+    while status is None:
+        t_old = solver.t
+        message = solver.step()
+        n_steps += 1
+        if solver.status == 'failed':
+            status = message
+        elif feed(solver.t, solver.y, t_old):
+            status = 'stopped'
+        elif solver.status == 'finished':
+            status = 'finished'
+
+    for obs in observers:
+        if hasattr(obs, 'finish'):
+            obs.finish(solver.t)
+    return {'t': solver.t, 'theta': solver.y, 'n_steps': n_steps, 'status': status}
+
+
+# ============================================================
+# MEMORY-MAPPED TRAJECTORY RECORDER
+# ============================================================
+def _times_path(path):
+    root, _ = os.path.splitext(path)
+    return root + '_times.npy'
+
+
+class TrajectoryRecorder:
+    """
+    Decimated phase snapshots written to a memory-mapped .npy file.
+
+    Snapshots are taken on the grid t_start + k * record_dt up to t_end and
+    stored as rows of a preallocated (n_snapshots, M) float32 array on
+    disk, so only the pages being written are held in memory. Driven by
+    integrate_observed the rows are interpolated exactly on the grid from
+    the solver's dense output; a plain update(t, theta) loop stores the
+    first state at or after each grid time.
+
+    With wrap=True phases are reduced modulo 2*pi before the cast to
+    float32, which would otherwise lose precision on long runs.
+    Call close() at the end; load_trajectory() reads the file back.
+    """
+
+    def __init__(self, path, n_oscillators, t_end, record_dt, t_start=0.0,
+                 dtype=np.float32, wrap=True):
+        n = int(np.floor((t_end - t_start) / record_dt + 1e-9)) + 1
+        self.path = path
+        self.wrap = wrap
+        self.times = t_start + record_dt * np.arange(n)
+        self._eps = 1e-9 * record_dt
+        self._data = np.lib.format.open_memmap(path, mode='w+', dtype=dtype,
+                                               shape=(n, n_oscillators))
+        self._next = 0
+
+    @property
+    def n_recorded(self):
+        return self._next
+
+    def _store(self, k, theta):
+        rows = np.mod(theta, 2 * np.pi) if self.wrap else theta
+        self._data[k] = rows
+
+    def update(self, t, theta):
+        while self._next < len(self.times) and self.times[self._next] <= t + self._eps:
+            self._store(self._next, theta)
+            self._next += 1
+
+    def update_dense(self, t_old, t, dense_output):
+        """Fill every grid row in (t_old, t] from the step interpolant."""
+        stop = np.searchsorted(self.times, t + self._eps, side='right')
+        if stop > self._next:
+            grid = self.times[self._next:stop]
+            self._store(slice(self._next, stop), dense_output()(grid).T)
+            self._next = stop
+
+    def close(self):
+        """Flush the phases and write the snapshot times next to them."""
+        self._data.flush()
+        np.save(_times_path(self.path), self.times[:self._next])
+        del self._data
+
+
+def load_trajectory(path):
+    """
+    Lazily open a file written by TrajectoryRecorder.
+
+    Returns:
+    --------
+    times : ndarray
+        Snapshot times
+    phases : numpy.memmap, shape (len(times), M)
+        Read-only view; rows are only read from disk when accessed
+    """
+    times = np.load(_times_path(path))
+    phases = np.load(path, mmap_mode='r')
+    return times, phases[:len(times)]
+
+
+def plot_phase_heatmap(path, ax=None, max_rows=1000, max_cols=1000, cmap='twilight'):
+    """
+    Phase heatmap (time x oscillator) of a recorded trajectory.
+
+    Only every k-th snapshot / oscillator is read from the memory map, so
+    at most max_rows x max_cols values are loaded whatever the file size.
+    """
+    import matplotlib.pyplot as plt
+
+    times, phases = load_trajectory(path)
+    row_step = max(1, int(np.ceil(phases.shape[0] / max_rows)))
+    col_step = max(1, int(np.ceil(phases.shape[1] / max_cols)))
+    image = np.asarray(phases[::row_step, ::col_step]).T
+    if ax is None:
+        ax = plt.gca()
+    im = ax.imshow(image, aspect='auto', origin='lower', cmap=cmap,
+                   extent=(times[0], times[-1], 0, phases.shape[1]))
+    ax.set_xlabel('Time')
+    ax.set_ylabel('Oscillator (prime index)')
+    return im
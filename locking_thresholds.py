@@ -0,0 +1,272 @@
+"""
+Analytic locking thresholds, without time integration.
+
+For all-to-all coupling
+
+    d theta_i / dt = omega_i + (K/M) * sum_j sin(theta_j - theta_i)
+
+a phase-locked state rotates at Omega = mean(omega) with
+sin(theta_i - psi) = (omega_i - Omega) / u, u = K r, and r must satisfy the
+finite-M self-consistency r = mean(sqrt(1 - ((omega_i - Omega) / u)^2)).
+The stable branch (all cosines >= 0) first exists at the locking threshold
+K_L = min over u of u / r(u) (Verwoerd & Mason 2008; Ermentrout 1985); the
+minimiser is the unique root of
+
+    h(u) = sum_i (1 - 2 x_i^2) / sqrt(1 - x_i^2),   x_i = (omega_i - Omega) / u,
+
+in (w_max, 2 w_max], w_max = max |omega_i - Omega|. For large M the root
+sits within ~1e-11 w_max of the singular end, so it is bracketed in
+log(u / w_max - 1); each evaluation of h is one O(M) pass over reused
+buffers, and M = 10^6 frequencies take ~15 passes (~0.15 s).
+
+For the Goldbach partial-permutation coupling every pair is a closed
+two-oscillator system; pair_thresholds sorts the per-pair critical
+couplings once, after which a coupling sweep is a sequence of binary
+searches.
+
+Note: prime_sync_kuramoto.py uses the opposite sign of the mean-field term
+(sin(theta_i - theta_j), repulsive). There the same locked state exists
+above K_L but is unstable; its attractive counterpart is integrated with
+interaction=+mean_field_coupling.
+"""
+
+import numpy as np
+from scipy.optimize import brentq
+
+
+def _centered(omega):
+    omega = np.asarray(omega, dtype=float)
+    if omega.size < 2:
+        raise ValueError("Need at least two oscillators")
+    Omega = omega.mean()
+    dw = omega - Omega
+    return Omega, dw, np.abs(dw).max()
+
+
+def _r(dw, u):
+    """mean(sqrt(1 - (dw / u)^2)), clipped at the edge of the domain."""
+    x = dw / u
+    return np.sqrt(np.clip(1.0 - x * x, 0.0, None)).mean()
+
+
+def _locked(Omega, dw, u, kappa):
+    r = _r(dw, u)
+    return {
+        'kappa': kappa,
+        'r': r,
+        'u': u,
+        'Omega': Omega,
+        'phases': np.arcsin(np.clip(dw / u, -1.0, 1.0)),
+    }
+
+
+def locking_threshold(omega, xtol=1e-5):
+    """
+    Exact finite-M locking threshold of the all-to-all Kuramoto model.
+
+    Parameters:
+    -----------
+    omega : array-like
+        Natural frequencies (any order)
+    xtol : float
+        Tolerance on log(u / w_max - 1); K_L = u / r(u) is stationary at
+        the root, so its error is of second order in this
+
+    Returns:
+    --------
+    results : dict
+        'kappa' (= K_L), 'r' (order parameter of the locked state at K_L),
+        'u' (= K_L * r), 'Omega' (common frequency = mean(omega)),
+        'phases' (locked phases relative to the mean phase psi, in the
+        input order)
+    """
+    Omega, dw, w_max = _centered(omega)
+    if w_max == 0:
+        # Identical oscillators are locked at any coupling
+        result = _locked(Omega, dw, 1.0, 0.0)
+        result['u'] = 0.0
+        return result
+
+    a = dw * dw
+    x2 = np.empty_like(a)
+    root = np.empty_like(a)
+
+    def h(log_delta):
+        # u = w_max * (1 + exp(log_delta)); x2 and root are reused buffers
+        np.multiply(a, 1.0 / (w_max * (1.0 + np.exp(log_delta)))**2, out=x2)
+        np.subtract(1.0, x2, out=root)
+        np.maximum(root, 0.0, out=root)
+        np.sqrt(root, out=root)
+        np.multiply(x2, -2.0, out=x2)
+        np.add(x2, 1.0, out=x2)
+        with np.errstate(divide='ignore'):
+            np.divide(x2, root, out=x2)
+        return x2.sum()
+
+    # h -> -inf at u = w_max (the extreme oscillator) and h(2 w_max) > 0;
+    # if h is already positive next to w_max the root is at w_max itself
+    lowest = np.log(4 * np.finfo(float).eps)
+    if h(lowest) >= 0:
+        log_delta = lowest
+    else:
+        log_delta = brentq(h, lowest, 0.0, xtol=xtol)
+    u = w_max * (1.0 + np.exp(log_delta))
+    r = _r(dw, u)
+    return _locked(Omega, dw, u, u / r)
+
+
+def locked_state(omega, kappa, threshold=None):
+    """
+    Stable phase-locked state at coupling kappa >= K_L.
+
+    Solves u = kappa * r(u) on the stable branch u >= u(K_L); pass the
+    result of locking_threshold(omega) as threshold to skip recomputing it.
+    Raises ValueError below the threshold, where no locked state exists.
+
+    Returns:
+    --------
+    results : dict
+        Same keys as locking_threshold, for the given kappa
+    """
+    if threshold is None:
+        threshold = locking_threshold(omega)
+    if kappa < threshold['kappa']:
+        raise ValueError(f"kappa={kappa} is below the locking threshold "
+                         f"K_L={threshold['kappa']:.6g}")
+    Omega, dw, _ = _centered(omega)
+    u_L = threshold['u']
+    if kappa == threshold['kappa'] or u_L == 0:
+        return dict(threshold)
+    u = brentq(lambda u: u - kappa * _r(dw, u), u_L, kappa)
+    return _locked(Omega, dw, u, kappa)
+
+
+# ============================================================
+# GOLDBACH PAIRS (partial-permutation coupling)
+# ============================================================
+# With goldbach_rhs, omega_i - (K/M) sin(theta_p - theta_i), every pair
+# (i, p) is a closed two-oscillator system. Its phase difference
+# phi = theta_i - theta_p obeys the Adler equation
+#     d phi / dt = dw + (2K/M) sin(phi),   dw = omega_i - omega_p,
+# which has a fixed point iff 2K/M >= |dw|. The coupling is repulsive, so
+# the stable fixed point has cos(phi) <= 0: a locked pair sits near
+# anti-phase and rotates at (omega_i + omega_p) / 2, which is N / 2 for
+# every pair when omega = primes. Unpaired primes (and a
+# self-paired N/2) are uncoupled and never lock.
+def pair_thresholds(omega, partner, M=None):
+    """
+    Critical coupling of every Goldbach pair, sorted.
+
+    Parameters:
+    -----------
+    omega : array-like
+        Natural frequencies
+    partner : array-like of int
+        goldbach_partners() output (-1 for unpaired primes)
+    M : int, optional
+        Coupling normalisation K/M (defaults to len(omega))
+
+    Returns:
+    --------
+    pairs : dict
+        'kappa_c' (ascending, M |dw| / 2), 'i', 'j' (pair members, same
+        order), 'dw' (omega_i - omega_j), 'n_unpaired', 'M'
+    """
+    omega = np.asarray(omega, dtype=float)
+    partner = np.asarray(partner)
+    if M is None:
+        M = len(omega)
+    i = np.flatnonzero(partner > np.arange(len(partner)))
+    j = partner[i]
+    dw = omega[i] - omega[j]
+    kappa_c = M * np.abs(dw) / 2
+    order = np.argsort(kappa_c, kind='stable')
+    return {
+        'kappa_c': kappa_c[order],
+        'i': i[order],
+        'j': j[order],
+        'dw': dw[order],
+        'n_unpaired': len(omega) - 2 * len(i),
+        'M': M,
+    }
+
+
+def goldbach_pair_thresholds(N):
+    """pair_thresholds for the model of find_kc: omega = primes below N."""
+    from goldbach_primes import get_primes, goldbach_partners
+
+    primes = get_primes(N)
+    return pair_thresholds(primes.astype(float), goldbach_partners(N, primes))
+
+
+def pair_locking_state(pairs, K):
+    """
+    Locked pairs and the order parameter over random initial phases at K.
+
+    Locked pairs are the prefix kappa_c <= K of the sorted thresholds. Each
+    locked pair is one rotor of amplitude |1 + exp(i phi*)|; all other
+    oscillators are counted as unit rotors (for a drifting pair the time
+    average of |1 + exp(i phi)|^2 is exactly 2). Every locked pair rotates
+    at (p + q) / 2 = N / 2, so the locked rotors keep the relative phases
+    they start with and do not decorrelate in time: R_rms and R_mean
+    describe R over independent uniform rotor phases, i.e. over random
+    initial conditions, not the long-time R of one run. Over that ensemble
+    the mean of R^2 is sum(amplitude^2) / M^2, and R is close to Rayleigh
+    distributed for many rotors.
+
+    Returns:
+    --------
+    state : dict
+        'n_locked', 'i', 'j' (members of the locked pairs),
+        'phi' (stable theta_i - theta_j of the locked pairs),
+        'amplitudes' (locked-pair rotor amplitudes), 'n_free'
+        (oscillators outside locked pairs), 'R_rms' (root mean square of R
+        over random initial phases), 'R_mean' (its Rayleigh mean)
+    """
+    n_locked = int(np.searchsorted(pairs['kappa_c'], K, side='right'))
+    M = pairs['M']
+    s = pairs['dw'][:n_locked] * M / (2 * K) if K > 0 else np.empty(0)
+    s = np.clip(s, -1.0, 1.0)
+    c = np.sqrt(1.0 - s * s)
+    phi = np.arctan2(-s, -c)
+    amplitudes = np.sqrt(2.0 - 2.0 * c)
+    n_free = M - 2 * n_locked
+    R_rms = np.sqrt((np.sum(amplitudes**2) + n_free) / M**2)
+    return {
+        'n_locked': n_locked,
+        'i': pairs['i'][:n_locked],
+        'j': pairs['j'][:n_locked],
+        'phi': phi,
+        'amplitudes': amplitudes,
+        'n_free': n_free,
+        'R_rms': R_rms,
+        'R_mean': R_rms * np.sqrt(np.pi) / 2,
+    }
+
+
+def sample_order_parameter(state, n_samples=1000, seed=None):
+    """
+    Samples of R over random initial phases: the rotors of
+    pair_locking_state with independent uniform phases, one draw per
+    sample (not a time series of one run).
+    """
+    rng = np.random.default_rng(seed)
+    amplitudes = np.concatenate([state['amplitudes'], np.ones(state['n_free'])])
+    M = 2 * state['n_locked'] + state['n_free']
+    R = np.empty(n_samples)
+    for k in range(n_samples):
+        R[k] = np.abs(amplitudes @ np.exp(2j * np.pi * rng.random(len(amplitudes)))) / M
+    return R
+
+
+def pair_locking_sweep(pairs, kappas):
+    """
+    Number of locked pairs and R_rms for every K in kappas.
+
+    Locked counts are binary searches in the sorted thresholds; R_rms needs
+    one pass over the locked prefix per K.
+    """
+    kappas = np.asarray(kappas, dtype=float)
+    n_locked = np.searchsorted(pairs['kappa_c'], kappas, side='right')
+    R_rms = np.array([pair_locking_state(pairs, K)['R_rms'] for K in kappas])
+    return {'kappas': kappas, 'n_locked': n_locked, 'R_rms': R_rms}
@@ -17,12 +17,6 @@ import matplotlib.pyplot as plt
 from time import time
 import sys
 
-print("="*70)
-print("НЕДЕЛЧЕВА ТЕОРЕМА: Пълна репликация на PDF-а")
-print("="*70)
-print("PDF: Prime_Synchronization_Theorem_2025_v3.pdf")
-print("="*70)
-
 # ============================================================================
 # КОНСТАНТИ ТОЧНО КАТО В PDF-а
 # ============================================================================
@@ -32,11 +26,6 @@ TARGET_R2 = 0.99995       # Точност от PDF-а (страница 2)
 N_REFERENCE = 30          # Референтна точка от експеримента
 KAPPA_REFERENCE = 174.2   # Експериментална стойност за N=30 (страница 5)
 
-print(f"\n📐 КОНСТАНТИ ОТ PDF-а:")
-print(f"  Уравнение (2): κ_c(N)·Γ(N) = {A_CONST}·N^{B_EXP}")
-print(f"  R² = {TARGET_R2} (за N=30 до 1000)")
-print(f"  N={N_REFERENCE}: κ_c ≈ {KAPPA_REFERENCE} (експериментално)")
-
 # ============================================================================
 # ЧАСТ 1: ГЕНЕРИРАНЕ НА ПРОСТИ ЧИСЛА (ОПТИМИЗИРАНО)
 # ============================================================================
@@ -425,6 +414,15 @@ def main():
     """
     ОСНОВНА ФУНКЦИЯ - ТОЧНА РЕПЛИКАЦИЯ НА PDF-а
     """
+    print("="*70)
+    print("НЕДЕЛЧЕВА ТЕОРЕМА: Пълна репликация на PDF-а")
+    print("="*70)
+    print("PDF: Prime_Synchronization_Theorem_2025_v3.pdf")
+    print("="*70)
+    print(f"\n📐 КОНСТАНТИ ОТ PDF-а:")
+    print(f"  Уравнение (2): κ_c(N)·Γ(N) = {A_CONST}·N^{B_EXP}")
+    print(f"  R² = {TARGET_R2} (за N=30 до 1000)")
+    print(f"  N={N_REFERENCE}: κ_c ≈ {KAPPA_REFERENCE} (експериментално)")
     print("\n🚀 СТАРТИРАМ ПЪЛНАТА ВАЛИДАЦИЯ...")
     print("   (Това може да отнеме 1-2 минути)")
     
@@ -5,9 +5,14 @@
 # ============================================================
 
 import numpy as np
-from scipy.integrate import odeint
 from sklearn.linear_model import LinearRegression
 
+from goldbach_primes import goldbach_partners
+from kuramoto_kernels import goldbach_rhs, partner_index
+from kuramoto_observers import (ODEINT_MXSTEP, IntegrationFailure, SteadyStateMonitor,
+                                checked_odeint, odeint_until_steady)
+from kc_solvers import kc_sweep
+
 def get_primes(n):
     sieve = [True] * n
     for i in range(3, int(n**0.5) + 1, 2):
@@ -15,48 +20,61 @@ def get_primes(n):
             sieve[i*i::2*i] = [False] * ((n - i*i - 1) // (2*i) + 1)
     return np.array([2] + [i for i in range(3, n, 2) if sieve[i]], dtype=float)
 
-def kuramoto_deriv(theta, t, omega, coupling_matrix, K, N_osc):
-    diff = theta[:, None] - theta
-    interaction = np.sum(coupling_matrix * np.sin(diff), axis=1)
-    return omega + (K / N_osc) * interaction
-
-def get_final_order(N, K, duration=20):
+# NaN when odeint fails: its partial output is not a state of the system
+def get_final_order(N, K, duration=20, monitor=None):
     primes = get_primes(N)
     M = len(primes)
     omega = primes
-    p_set = set(primes)
-    W = np.zeros((M, M))
-    for i, p in enumerate(primes):
-        target = N - p
-        if target in p_set:
-            j = np.where(primes == target)[0][0]
-            W[i, j] = 1.0
+    idx = partner_index(goldbach_partners(N, primes.astype(np.int64)))
     theta0 = np.random.uniform(0, 2*np.pi, M)
     t = np.linspace(0, duration, 100)
-    sol = odeint(kuramoto_deriv, theta0, t, args=(omega, W, K, M))
-    return np.abs(np.mean(np.exp(1j * sol[-1])))
+    try:
+        if monitor is not None:
+            # Early exit once R(t) is clearly locked or incoherent (see monitor.reason)
+            theta, _ = odeint_until_steady(goldbach_rhs, theta0, t, (omega, idx, K, M), monitor,
+                                           mxstep=ODEINT_MXSTEP)
+        else:
+            theta = checked_odeint(goldbach_rhs, theta0, t, (omega, idx, K, M),
+                                   mxstep=ODEINT_MXSTEP)[-1]
+    except IntegrationFailure:
+        return np.nan
+    return np.abs(np.mean(np.exp(1j * theta)))
 
-def find_critical_coupling_precise(N):
+def find_critical_coupling_precise(N, early_stop=True, log=None):
     low, high = 0, N * 2.5
     for _ in range(12):
         mid = (low + high) / 2
-        if get_final_order(N, mid) > 0.5:
+        monitor = SteadyStateMonitor(threshold=0.5) if early_stop else None
+        R = get_final_order(N, mid, monitor=monitor)
+        if log is not None and monitor is not None:
+            log.append((mid, R, monitor.stop_time, monitor.reason))
+        if np.isnan(R):
+            return np.nan  # Undecided step: the bracket cannot be narrowed
+        if R > 0.5:
             high = mid
         else:
             low = mid
+    if high == N * 2.5 or low == 0:
+        return np.nan  # R never crossed 0.5: the bracket edge is not a Kc
     return (low + high) / 2
 
-# Test Execution
-N_vals = [200, 300, 400, 500, 600, 700, 800, 900, 1000]
-kc_vals = [find_critical_coupling_precise(N) for N in N_vals]
+# Test Execution (one bisection per N in a process pool)
+if __name__ == "__main__":
+    N_vals = [200, 300, 400, 500, 600, 700, 800, 900, 1000]
+    kc_vals = kc_sweep(find_critical_coupling_precise, N_vals, seed=0)['kc']
 
-# Linear Regression
-X = np.array(N_vals).reshape(-1, 1)
-y = np.array(kc_vals)
-model = LinearRegression().fit(X, y)
+    # Linear Regression (only N with a decided Kc: no integrator failure and
+    # R = 0.5 bracketed by [0, 2.5 N])
+    valid = np.isfinite(kc_vals)
+    X = np.array(N_vals)[valid].reshape(-1, 1)
+    y = np.array(kc_vals)[valid]
 
-print(f"RESULTS:")
-for N, kc in zip(N_vals, kc_vals):
-    print(f"N={N} | Kc={kc:.2f}")
-print(f"R^2 Score: {model.score(X, y):.5f}")
-print(f"Slope (Alpha): {model.coef_[0]:.3f}")
\ No newline at end of file
+    print(f"RESULTS:")
+    for N, kc in zip(N_vals, kc_vals):
+        print(f"N={N} | Kc={kc:.2f}" if np.isfinite(kc) else f"N={N} | Kc undecided (odeint failed or R = 0.5 not bracketed)")
+    if len(y) >= 2:
+        model = LinearRegression().fit(X, y)
+        print(f"R^2 Score: {model.score(X, y):.5f} ({len(y)} of {len(N_vals)} N)")
+        print(f"Slope (Alpha): {model.coef_[0]:.3f}")
+    else:
+        print("Too few valid Kc values for a fit")
\ No newline at end of file
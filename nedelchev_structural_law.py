@@ -7,27 +7,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 from sklearn.linear_model import LinearRegression
 
-def get_primes(n):
-    """Sieve of Eratosthenes to generate primes up to n."""
-    sieve = np.ones(n, dtype=bool)
-    sieve[:2] = False
-    for i in range(2, int(n**0.5) + 1):
-        if sieve[i]:
-            sieve[i*i:n:i] = False
-    return np.where(sieve)[0]
-
-def goldbach_matrix(N):
-    """Generates the Goldbach connectivity matrix for a given N."""
-    primes = get_primes(N)
-    M = len(primes)
-    idx = {p: i for i, p in enumerate(primes)}
-    
-    W = np.zeros((M, M))
-    for i, p in enumerate(primes):
-        q = N - p
-        if q in idx:
-            W[i, idx[q]] = 1.0
-    return W
+# W_N is goldbach_primes.goldbach_matrix; spectral_radii builds and
+# decomposes it for every N
+from goldbach_spectra import spectral_radii
 
 def run_stability_test(Ns):
     """Measures the Spectral Radius and Critical Coupling for various scales."""
@@ -37,12 +19,11 @@ def run_stability_test(Ns):
     print(f"{'N':>5} | {'λ_max':>10} | {'κc (1/λ)':>10}")
     print("-" * 35)
     
-    for N in Ns:
-        W = goldbach_matrix(N)
-        # Calculate eigenvalues
-        eigs = np.linalg.eigvals(W)
-        l_max = np.max(np.abs(eigs))
-        
+    # W is symmetric, so all scales are decomposed together with
+    # stacked eigvalsh calls instead of one eigvals call per N
+    l_max_all = spectral_radii(Ns)
+    
+    for N, l_max in zip(Ns, l_max_all):
         # In the Nedelchev Law, Kc = 1 / lambda_max
         # Since lambda_max = 1 for Goldbach, Kc = 1
         kc = 1.0 / l_max if l_max > 0 else np.nan
@@ -11,6 +11,12 @@ import numpy as np
 import matplotlib.pyplot as plt
 import math
 
+from goldbach_primes import get_primes
+from kc_solvers import continuation_sweep
+from kuramoto_integrators import integrate_ensemble, noisy_ensemble, order_parameter
+from kuramoto_kernels import mean_field_coupling
+from locking_thresholds import locking_threshold
+
 def is_prime(n):
     if n < 2: return False
     for i in range(2, int(math.sqrt(n)) + 1):
@@ -28,7 +34,7 @@ def kuramoto_simulation(N, kappa):
     dt = 0.015
     steps = 2500
     
-    primes = [x for x in range(2, N) if is_prime(x)]
+    primes = get_primes(N)
     n_osc = len(primes)
     if n_osc < 2: return 0
     
@@ -36,36 +42,98 @@ def kuramoto_simulation(N, kappa):
     omega = np.array(primes, dtype=float)
     phases = np.random.uniform(0, 2*np.pi, n_osc)
     
-    # Vectorized simulation of the Kuramoto dynamics
+    # Mean-field simulation of the Kuramoto dynamics, O(M) per step:
+    # (kappa/M) * sum_j sin(theta_i - theta_j) = -kappa * R * sin(psi - theta_i)
     for _ in range(steps):
-        phase_diffs = phases[:, None] - phases
-        interaction = (kappa / n_osc) * np.sum(np.sin(phase_diffs), axis=1)
+        interaction = -kappa * mean_field_coupling(phases)
         phases += (omega + interaction) * dt
     
     # Return Order Parameter R
     return np.abs(np.mean(np.exp(1j * phases)))
 
+def kuramoto_sweep(N, kappas):
+    """Simulates every coupling strength at once as a (K, M) ensemble."""
+    primes = get_primes(N)
+    n_osc = len(primes)
+    if n_osc < 2: return np.zeros(len(kappas))
+    
+    omega = primes.astype(float)
+    phases = np.random.uniform(0, 2*np.pi, (len(kappas), n_osc))
+    
+    # Same dynamics and step as kuramoto_simulation, one vectorized step for all kappas
+    phases = integrate_ensemble(omega, kappas, phases, dt=0.015, steps=2500,
+                                interaction=lambda th: -mean_field_coupling(th))
+    return order_parameter(phases)
+
+def noise_robustness(N, kappas, noise_level=0.05, n_realizations=8, seed=0):
+    """
+    Mean and spread of R(kappa) under additive phase noise of strength
+    noise_level * std(omega), over n_realizations independent noise streams.
+    """
+    primes = get_primes(N)
+    omega = primes.astype(float)
+    members = np.repeat(np.asarray(kappas, dtype=float), n_realizations)
+    
+    # kappa * (-mean_field) == (-kappa) * mean_field keeps the kernel picklable
+    phases = noisy_ensemble(omega, -members, dt=0.015, steps=2500,
+                            interaction=mean_field_coupling,
+                            sigma=noise_level * np.std(omega), seed=seed)
+    R = order_parameter(phases).reshape(len(kappas), n_realizations)
+    return R.mean(axis=1), R.std(axis=1)
+
+def kuramoto_continuation(N, kappas, steps=300, warmup_steps=2500):
+    """
+    Forward and backward continuation sweep: the first kappa runs the full
+    transient (warmup_steps), every further kappa starts from the final
+    phases of its neighbour and only needs a short settling run (steps).
+    """
+    primes = get_primes(N)
+    omega = primes.astype(float)
+    
+    def run(n_steps):
+        return lambda theta, kappa: integrate_ensemble(
+            omega, [kappa], theta, dt=0.015, steps=n_steps,
+            interaction=lambda th: -mean_field_coupling(th))[0]
+    
+    theta0 = np.random.uniform(0, 2*np.pi, len(primes))
+    return continuation_sweep(run(steps), kappas, theta0, warmup=run(warmup_steps))
+
 # --- Execution ---
-N = 500
-A, B = 2.539, 0.9327 # Nedelchev Constants
-gamma = get_gamma(N)
-kappa_theory = (A * (N**B)) / gamma
+if __name__ == "__main__":
+    N = 500
+    A, B = 2.539, 0.9327 # Nedelchev Constants
+    gamma = get_gamma(N)
+    kappa_theory = (A * (N**B)) / gamma
 
-print(f"Predicted Critical Coupling (Kappa_c): {kappa_theory:.4f}")
+    print(f"Predicted Critical Coupling (Kappa_c): {kappa_theory:.4f}")
+    # Exact finite-M locking threshold of the attractive all-to-all model
+    # (the mean-field term below is repulsive: its locked state is unstable)
+    kappa_lock = locking_threshold(get_primes(N))['kappa']
+    print(f"All-to-all locking threshold (Kappa_L): {kappa_lock:.4f}")
 
-# Sweep through coupling strengths
-kappas = np.linspace(200, 1500, 25)
-R_results = [kuramoto_simulation(N, k) for k in kappas]
+    # Sweep through coupling strengths
+    kappas = np.linspace(200, 1500, 25)
+    R_results = kuramoto_sweep(N, kappas)
+    branches = kuramoto_continuation(N, kappas)
+    R_noise, R_noise_std = noise_robustness(N, kappas)
+    print(f"Max |R_backward - R_forward|: {branches['max_gap']:.3f}, "
+          f"hysteresis range: {branches['hysteresis_range']}")
 
-# Plotting the Result
-plt.figure(figsize=(12, 6))
-plt.plot(kappas, R_results, 'bo-', linewidth=2, label='Experimental Order Parameter (R)')
-plt.axvline(x=kappa_theory, color='red', linestyle='--', linewidth=3, 
-            label=f'Nedelchev Threshold ({kappa_theory:.2f})')
+    # Plotting the Result
+    plt.figure(figsize=(12, 6))
+    plt.plot(kappas, R_results, 'bo-', linewidth=2, label='Experimental Order Parameter (R)')
+    plt.plot(kappas, branches['R_forward'], 'g^--', label='Continuation, increasing Kappa')
+    plt.plot(kappas, branches['R_backward'], 'mv--', label='Continuation, decreasing Kappa')
+    plt.errorbar(kappas, R_noise, yerr=R_noise_std, fmt='ks:', capsize=3,
+                 label='5% phase noise (mean ± std, 8 realizations)')
+    plt.axvline(x=kappa_theory, color='red', linestyle='--', linewidth=3, 
+                label=f'Nedelchev Threshold ({kappa_theory:.2f})')
+    plt.axvline(x=kappa_lock, color='gray', linestyle=':', linewidth=2,
+                label=f'All-to-all locking threshold ({kappa_lock:.2f})')
 
-plt.title(f"Dynamic Synchronization Validation (N={N})", fontsize=16)
-plt.xlabel("Coupling Strength (Kappa)", fontsize=14)
-plt.ylabel("Order Parameter (R)", fontsize=14)
-plt.grid(True, alpha=0.3)
-plt.legend()
-plt.show()
+    plt.title(f"Dynamic Synchronization Validation (N={N})", fontsize=16)
+    plt.xlabel("Coupling Strength (Kappa)", fontsize=14)
+    plt.ylabel("Order Parameter (R)", fontsize=14)
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+    plt.show()
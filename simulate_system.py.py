@@ -3,6 +3,9 @@ Prime Synchronization Theorem - Main Simulation
 Simulates the prime-coupled Kuramoto oscillator system.
 """
 
+import os
+import tempfile
+
 import numpy as np
 from scipy.integrate import solve_ivp
 from scipy.sparse import csr_matrix
@@ -10,6 +13,10 @@ from scipy.sparse.csgraph import laplacian
 import networkx as nx
 import matplotlib.pyplot as plt
 from sympy import isprime
+from kc_solvers import frequency_spread_bounds, illinois_kc, kappa_c_empirical, newton_kc
+from kuramoto_kernels import order_parameter_sensitivity
+from kuramoto_observers import (SteadyStateMonitor, TailOrderParameter, LockedPairs,
+                                TrajectoryRecorder, integrate_observed, load_trajectory)
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -36,6 +43,10 @@ class PrimeSynchronization:
         self.degrees = self.adjacency.sum(axis=1)
         self.avg_degree = np.mean(self.degrees)
         
+        # Edge list (i, j) of the adjacency, used by the vectorized ODE
+        self.edge_i, self.edge_j = np.nonzero(self.adjacency)
+        self._build_jacobian_pattern()
+        
         print(f"System initialized for N={N}")
         print(f"  Primes: {self.primes}")
         print(f"  Number of oscillators: {self.m}")
@@ -62,66 +73,196 @@ class PrimeSynchronization:
         
         return adj
     
+    def _build_jacobian_pattern(self):
+        """CSR pattern of the Jacobian: the diagonal plus one entry per edge."""
+        m = self.m
+        rows = np.concatenate([self.edge_i, np.arange(m)])
+        cols = np.concatenate([self.edge_j, np.arange(m)])
+        pattern = csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(m, m))
+        pattern.sort_indices()
+        self._jac_indices = pattern.indices
+        self._jac_indptr = pattern.indptr
+        # CSR order is row-major, so flat keys i*m + j are sorted
+        keys = np.repeat(np.arange(m), np.diff(pattern.indptr)) * m + pattern.indices
+        self._jac_pos = np.searchsorted(keys, rows * m + cols)
+    
+    def kuramoto_jacobian(self, t, theta, kappa):
+        """
+        Analytic Jacobian of kuramoto_ode as a sparse CSR matrix.
+        
+        d f_i / d theta_j = g cos(theta_j - theta_i) for every Goldbach edge and
+        d f_i / d theta_i = -g sum_j cos(theta_j - theta_i), with g = kappa / avg_degree.
+        Built in O(M) on the fixed pattern from _build_jacobian_pattern.
+        """
+        g = kappa / self.avg_degree
+        c = g * np.cos(theta[self.edge_j] - theta[self.edge_i])
+        diag = -np.bincount(self.edge_i, weights=c, minlength=self.m)
+        data = np.bincount(self._jac_pos, weights=np.concatenate([c, diag]),
+                           minlength=len(self._jac_indices))
+        return csr_matrix((data, self._jac_indices, self._jac_indptr),
+                          shape=(self.m, self.m))
+    
+    def _solver_options(self, kappa, method):
+        """solve_ivp options; implicit methods get the analytic Jacobian."""
+        options = dict(method=method, rtol=1e-8, atol=1e-10)
+        if method in ('BDF', 'Radau'):
+            options['jac'] = lambda t, y: self.kuramoto_jacobian(t, y, kappa)
+        elif method == 'LSODA':
+            # LSODA's Fortran core only takes dense (or banded) Jacobians
+            options['jac'] = lambda t, y: self.kuramoto_jacobian(t, y, kappa).toarray()
+        return options
+    
     def kuramoto_ode(self, t, theta, kappa):
         """Kuramoto ODE for the system."""
-        dtheta = np.zeros_like(theta)
+        # Coupling term (only with Goldbach pairs), scatter-added over edges
+        coupling = np.bincount(
+            self.edge_i,
+            weights=np.sin(theta[self.edge_j] - theta[self.edge_i]),
+            minlength=self.m
+        )
         
-        for i in range(self.m):
-            # Natural frequency term
-            dtheta[i] = self.frequencies[i]
-            
-            # Coupling term (only with Goldbach pairs)
-            for j in range(self.m):
-                if self.adjacency[i, j]:
-                    dtheta[i] += (kappa / self.avg_degree) * np.sin(theta[j] - theta[i])
+        # Natural frequency term
+        return self.frequencies + (kappa / self.avg_degree) * coupling
+    
+    def kuramoto_sensitivity_ode(self, t, y, kappa):
+        """
+        Kuramoto ODE extended by the forward sensitivity s = d theta / d kappa.
         
-        return dtheta
+        y = [theta, s]; ds_i/dt = (1/d) sum_j sin(theta_j - theta_i)
+        + (kappa/d) sum_j cos(theta_j - theta_i) (s_j - s_i), i.e. the kappa
+        derivative of the RHS plus the Jacobian applied to s, over the same
+        edge lists (O(edges)).
+        """
+        m = self.m
+        theta, s = y[:m], y[m:]
+        d = theta[self.edge_j] - theta[self.edge_i]
+        coupling = np.bincount(self.edge_i, weights=np.sin(d), minlength=m)
+        linear = np.bincount(self.edge_i, weights=np.cos(d) * (s[self.edge_j] - s[self.edge_i]),
+                             minlength=m)
+        g = kappa / self.avg_degree
+        return np.concatenate([self.frequencies + g * coupling,
+                               (coupling + kappa * linear) / self.avg_degree])
     
-    def simulate(self, kappa, t_span=(0, 100), initial_phases=None):
+    def simulate(self, kappa, t_span=(0, 100), initial_phases=None, monitor=None,
+                 method='RK45'):
         """
         Simulate system for given coupling strength.
         
+        Parameters:
+        -----------
+        method : str
+            solve_ivp method; the implicit 'BDF', 'Radau' and 'LSODA' use the
+            analytic sparse Jacobian (kuramoto_jacobian) near locking, where
+            the system becomes stiff
+        monitor : SteadyStateMonitor, optional
+            Ends the integration through a terminal event as soon as the
+            order parameter has settled clearly above or below its threshold
+        
         Returns:
         --------
         sol : OdeSolution
-            Solution object from solve_ivp
+            Solution object from solve_ivp, with stop_time and stop_reason
+            ('locked', 'incoherent' or 'horizon') when a monitor is given
         """
         if initial_phases is None:
             initial_phases = 2 * np.pi * np.random.rand(self.m)
         
+        fun = lambda t, y: self.kuramoto_ode(t, y, kappa)
+        events = None
+        if monitor is not None:
+            monitor.reset()
+            events = monitor.event(fun)
+        
         # Solve ODE
         sol = solve_ivp(
-            fun=lambda t, y: self.kuramoto_ode(t, y, kappa),
+            fun=fun,
             t_span=t_span,
             y0=initial_phases,
-            method='RK45',
-            rtol=1e-8,
-            atol=1e-10
+            events=events,
+            **self._solver_options(kappa, method)
         )
         
+        if monitor is not None:
+            monitor.finish(sol.t[-1])
+            sol.stop_time = monitor.stop_time
+            sol.stop_reason = monitor.reason
+        
         return sol
     
+    def observe(self, kappa, observers, t_span=(0, 100), initial_phases=None, method='RK45'):
+        """
+        Integrate with the same solver settings as simulate(), but stream
+        each step to observers instead of storing the trajectory.
+        
+        Returns:
+        --------
+        results : dict
+            From integrate_observed: final 't', 'theta', 'n_steps', 'status'
+        """
+        if initial_phases is None:
+            initial_phases = 2 * np.pi * np.random.rand(self.m)
+        
+        return integrate_observed(
+            lambda t, y: self.kuramoto_ode(t, y, kappa),
+            t_span, initial_phases, observers,
+            **self._solver_options(kappa, method)
+        )
+    
     def order_parameter(self, theta):
         """Calculate synchronization order parameter."""
         return np.abs(np.sum(np.exp(1j * theta))) / len(theta)
     
-    def find_critical_kappa(self, kappa_range=(0, 1000), tol=1.0):
+    def sensitivity(self, kappa, t_span=(0, 200), initial_phases=None):
+        """
+        Final order parameter and its kappa derivative from one run.
+        
+        Integrates kuramoto_sensitivity_ode (explicit RK45, only the end
+        point is stored) from s = 0.
+        
+        Returns:
+        --------
+        r, dr_dkappa : float
+        """
+        if initial_phases is None:
+            initial_phases = 2 * np.pi * np.random.rand(self.m)
+        
+        sol = solve_ivp(
+            fun=lambda t, y: self.kuramoto_sensitivity_ode(t, y, kappa),
+            t_span=t_span,
+            y0=np.concatenate([initial_phases, np.zeros(self.m)]),
+            t_eval=[t_span[1]],
+            method='RK45', rtol=1e-8, atol=1e-10
+        )
+        final = sol.y[:, -1]
+        return order_parameter_sensitivity(final[:self.m], final[self.m:])
+    
+    def find_critical_kappa(self, kappa_range=(0, 1000), tol=1.0, early_stop=True,
+                            method='RK45'):
         """
         Find critical coupling strength via binary search.
         
+        With early_stop each run ends once r(t) is clearly above or below
+        0.7; self.search_log lists (kappa, r, stop_time, reason) per run.
+        
         Returns:
         --------
         kappa_c : float
             Estimated critical coupling
         """
         kappa_low, kappa_high = kappa_range
+        monitor = SteadyStateMonitor(threshold=0.7, window=10.0, sample_dt=0.5)
+        self.search_log = []
         
         for _ in range(20):  # Max 20 iterations
             kappa_mid = (kappa_low + kappa_high) / 2
+            monitor.reset()
             
-            # Simulate and check synchronization
-            sol = self.simulate(kappa_mid, t_span=(0, 200))
-            r_final = self.order_parameter(sol.y[:, -1])
+            # Simulate and check synchronization (only the final state is kept)
+            run = self.observe(kappa_mid, [monitor] if early_stop else [], t_span=(0, 200),
+                               method=method)
+            r_final = self.order_parameter(run['theta'])
+            self.search_log.append((kappa_mid, r_final, run['t'],
+                                    monitor.reason if early_stop else 'horizon'))
             
             if r_final > 0.7:  # Synchronized
                 kappa_high = kappa_mid
@@ -132,9 +273,72 @@ class PrimeSynchronization:
                 break
         
         return (kappa_low + kappa_high) / 2
+    
+    def find_critical_kappa_guided(self, kappa_range=(0, 1000), tol=1.0, method='RK45'):
+        """
+        Critical coupling from model-guided brackets.
+        
+        Starts from Equation (2), kappa_c_empirical(N), inside kappa_range
+        and refines with Illinois steps on r(kappa) - 0.7 until the bracket
+        is narrower than tol. Every prime has at most one Goldbach partner,
+        so each edge is a closed pair that locks iff
+        kappa >= avg_degree * |dw| / 2. No pair is locked below the lower
+        end of frequency_spread_bounds, so the guess is raised to it; the
+        bracket stays kappa_range, since locking every pair does not make
+        r reach 0.7 (unpaired primes never lock).
+        
+        Returns:
+        --------
+        results : dict
+            From illinois_kc ('kappa_c', 'n_evaluations', 'converged', ...)
+        """
+        partner = np.arange(self.m)
+        partner[self.edge_i] = self.edge_j
+        first_lock, _ = frequency_spread_bounds(self.frequencies, partner, self.avg_degree)
+        monitor = SteadyStateMonitor(threshold=0.7, window=10.0, sample_dt=0.5)
+        
+        def evaluate(kappa):
+            monitor.reset()
+            run = self.observe(kappa, [monitor], t_span=(0, 200), method=method)
+            return self.order_parameter(run['theta'])
+        
+        return illinois_kc(evaluate, max(kappa_c_empirical(self.N), first_lock),
+                           lower=kappa_range[0], upper=kappa_range[1], threshold=0.7, tol=tol)
+    
+    def find_critical_kappa_newton(self, kappa_range=(0, 1000), tol=1.0, max_evals=12):
+        """
+        Critical coupling by safeguarded Newton steps on r(kappa) - 0.7.
+        
+        Each evaluation is one sensitivity() run giving r and dr/dkappa; all
+        runs share one set of initial phases. Starts from the same guess as
+        find_critical_kappa_guided, inside kappa_range.
+        
+        Returns:
+        --------
+        results : dict
+            From newton_kc ('kappa_c', 'n_evaluations', 'converged', ...)
+        """
+        partner = np.arange(self.m)
+        partner[self.edge_i] = self.edge_j
+        first_lock, _ = frequency_spread_bounds(self.frequencies, partner, self.avg_degree)
+        initial_phases = 2 * np.pi * np.random.rand(self.m)
+        return newton_kc(lambda kappa: self.sensitivity(kappa, initial_phases=initial_phases),
+                         max(kappa_c_empirical(self.N), first_lock), lower=kappa_range[0],
+                         upper=kappa_range[1], threshold=0.7, tol=tol, max_evals=max_evals)
 
-def main():
-    """Example usage and demonstration."""
+def main(record=None, method='guided'):
+    """
+    Example usage and demonstration.
+    
+    Parameters:
+    -----------
+    record : str, optional
+        Keep the phase-evolution snapshots in this .npy file (default: a
+        temporary file that is removed afterwards)
+    method : str
+        kappa_c search: 'guided' (Illinois steps, find_critical_kappa_guided)
+        or 'newton' (Newton steps with dr/dkappa, find_critical_kappa_newton)
+    """
     print("=" * 60)
     print("PRIME SYNCHRONIZATION THEOREM - SIMULATION")
     print("=" * 60)
@@ -144,9 +348,22 @@ def main():
     
     # Find critical coupling
     print("\nFinding critical coupling κ_c...")
-    kappa_c = system.find_critical_kappa()
-    print(f"  Estimated κ_c(30) = {kappa_c:.2f}")
+    if method == 'newton':
+        search = system.find_critical_kappa_newton()
+    else:
+        search = system.find_critical_kappa_guided()
+    if search['converged']:
+        kappa_c = search['kappa_c']
+        print(f"  Estimated κ_c(30) = {kappa_c:.2f} (evaluations: {search['n_evaluations']})")
+    else:
+        # The search ended at an edge of kappa_range: that is not a measurement
+        kappa_c = None
+        kappa_last, r_last = search['history'][-1][:2]
+        print(f"  No r = 0.7 crossing found in κ ∈ [0, 1000] (evaluations: "
+              f"{search['n_evaluations']}, last r = {r_last:.3f} at κ = {kappa_last:.1f})")
     print(f"  Theoretical value ≈ 174.2")
+    # Phase plot at the estimate, or at the theoretical value without one
+    kappa_shown = 174.2 if kappa_c is None else kappa_c
     
     # Simulate below and above critical coupling
     print("\nSimulating system dynamics:")
@@ -154,24 +371,37 @@ def main():
     kappas = [50, 174.2, 300]  # Subcritical, critical, supercritical
     results = []
     
+    # Goldbach partner of every prime (itself when unpaired)
+    partner = np.arange(system.m)
+    partner[system.edge_i] = system.edge_j
+    
     for kappa in kappas:
-        sol = system.simulate(kappa, t_span=(0, 150))
-        r_final = system.order_parameter(sol.y[:, -1])
+        r_tail = TailOrderParameter(t_start=100)
+        locked = LockedPairs(partner, t_start=100)
+        run = system.observe(kappa, [r_tail, locked], t_span=(0, 150))
+        r_final = system.order_parameter(run['theta'])
         results.append((kappa, r_final))
         
         status = "SYNCHRONIZED" if r_final > 0.7 else "NOT SYNCHRONIZED"
-        print(f"  κ = {kappa:6.1f} → r = {r_final:.3f} ({status})")
+        print(f"  κ = {kappa:6.1f} → r = {r_final:.3f} ({status}), "
+              f"<r>_tail = {r_tail.result():.3f}, locked pairs = {locked.result()}")
     
     # Create visualization
     fig, axes = plt.subplots(1, 2, figsize=(12, 5))
     
-    # Plot 1: Phase evolution for critical kappa
-    sol_critical = system.simulate(kappa_c, t_span=(0, 100))
-    for i in range(min(5, system.m)):  # Plot first 5 oscillators
-        axes[0].plot(sol_critical.t, sol_critical.y[i], label=f'p={system.primes[i]}')
+    # Plot 1: Phase evolution for critical kappa (recorded to disk, read lazily)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = record or os.path.join(tmp, 'phase_evolution.npy')
+        recorder = TrajectoryRecorder(path, system.m, t_end=100, record_dt=0.05, wrap=False)
+        system.observe(kappa_shown, [recorder], t_span=(0, 100))
+        recorder.close()
+        t_rec, phases = load_trajectory(path)
+        for i in range(min(5, system.m)):  # Plot first 5 oscillators
+            axes[0].plot(t_rec, np.array(phases[:, i]), label=f'p={system.primes[i]}')
+        del phases
     axes[0].set_xlabel('Time (τ)')
     axes[0].set_ylabel('Phase Θ')
-    axes[0].set_title(f'Phase Evolution for κ = {kappa_c:.1f}')
+    axes[0].set_title(f'Phase Evolution for κ = {kappa_shown:.1f}')
     axes[0].legend()
     axes[0].grid(True, alpha=0.3)
     
@@ -179,11 +409,15 @@ def main():
     test_kappas = np.linspace(0, 350, 20)
     r_values = []
     for k in test_kappas:
-        sol = system.simulate(k, t_span=(0, 100))
-        r_values.append(system.order_parameter(sol.y[:, -1]))
+        run = system.observe(k, [], t_span=(0, 100))
+        r_values.append(system.order_parameter(run['theta']))
     
     axes[1].plot(test_kappas, r_values, 'b-o', linewidth=2, markersize=6)
-    axes[1].axvline(x=kappa_c, color='r', linestyle='--', label=f'κ_c = {kappa_c:.1f}')
+    if kappa_c is None:
+        axes[1].axvline(x=kappa_shown, color='gray', linestyle=':',
+                        label=f'theoretical κ_c ≈ {kappa_shown:.1f}')
+    else:
+        axes[1].axvline(x=kappa_c, color='r', linestyle='--', label=f'κ_c = {kappa_c:.1f}')
     axes[1].set_xlabel('Coupling Strength (κ)')
     axes[1].set_ylabel('Order Parameter (r)')
     axes[1].set_title('Synchronization Transition')
@@ -199,4 +433,12 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Prime synchronization simulation (N=30)")
+    parser.add_argument('--record', metavar='PATH',
+                        help="keep the phase-evolution snapshots in this .npy file")
+    parser.add_argument('--method', choices=('guided', 'newton'), default='guided',
+                        help="kappa_c search: Illinois steps or Newton steps with dr/dkappa")
+    args = parser.parse_args()
+    main(record=args.record, method=args.method)
\ No newline at end of file
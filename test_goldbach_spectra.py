@@ -0,0 +1,24 @@
+import networkx as nx
+import numpy as np
+
+from goldbach_bridge import GoldbachBridge
+from goldbach_spectra import slq_spectral_density
+
+
+def test_slq_lambda_2_of_bridge_giant_component():
+    # The bridge is disconnected ({2, 4} is its own component), so lambda_2
+    # must come from the largest component rather than collapse to 0
+    bridge = GoldbachBridge(200)
+    density = slq_spectral_density(bridge.laplacian())
+
+    G = bridge.to_networkx()
+    giant = max(nx.connected_components(G), key=len)
+    L_giant = nx.laplacian_matrix(G.subgraph(giant)).toarray()
+    expected = np.linalg.eigvalsh(L_giant)[1]
+    full = np.linalg.eigvalsh(nx.laplacian_matrix(G).toarray())
+
+    assert density['n_components'] == nx.number_connected_components(G) > 1
+    assert density['giant_size'] == len(giant)
+    assert density['lambda_2'] > 0
+    np.testing.assert_allclose(density['lambda_2'], expected, rtol=1e-8)
+    np.testing.assert_allclose(density['lambda_max'], full[-1], rtol=1e-8)
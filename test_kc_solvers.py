@@ -0,0 +1,37 @@
+import numpy as np
+
+from kc_solvers import goldbach_kc_statistical, statistical_bisection
+
+
+def noisy_step(kappa_c, low_R, high_R, sigma, seed=0):
+    rng = np.random.default_rng(seed)
+
+    def evaluate(kappa, seeds):
+        return (high_R if kappa > kappa_c else low_R) + sigma * rng.standard_normal(len(seeds))
+
+    return evaluate
+
+
+def test_statistical_bisection_brackets_the_crossing():
+    result = statistical_bisection(noisy_step(321.0, 0.2, 0.8, 0.05), 0.0, 1000.0)
+
+    assert result['bracketed'] and result['resolved']
+    assert result['low'] <= 321.0 <= result['high']
+    assert result['high'] - result['low'] <= 1.0
+
+
+def test_statistical_bisection_without_crossing_is_unresolved():
+    # R stays below the threshold everywhere: the edge is not a kappa_c
+    result = statistical_bisection(noisy_step(np.inf, 0.1, 0.1, 0.01), 0.0, 1000.0)
+
+    assert not result['bracketed'] and not result['resolved']
+    assert np.isnan(result['kappa_c'])
+    assert [h[0] for h in result['history']] == [0.0, 1000.0]  # only the ends
+
+
+def test_goldbach_kc_statistical_does_not_report_the_bracket_edge():
+    # The repulsive Goldbach coupling keeps R ~ 0.1 on [0, 2.5 N]
+    result = goldbach_kc_statistical(200)
+
+    assert not result['bracketed']
+    assert np.isnan(result['kappa_c'])
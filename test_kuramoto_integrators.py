@@ -0,0 +1,69 @@
+import tracemalloc
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from goldbach_primes import get_primes, goldbach_partners
+from kuramoto_integrators import (EulerWorkspace, noisy_ensemble, order_parameter, pair_flow,
+                                  rotating_frame_integrate)
+from kuramoto_kernels import goldbach_rhs_ivp, mean_field_coupling, partner_index
+
+
+def goldbach_system(N):
+    primes = get_primes(N)
+    return primes.astype(float), partner_index(goldbach_partners(N, primes))
+
+
+def test_euler_workspace_step_allocates_no_arrays():
+    omega, idx = goldbach_system(20000)
+    for dtype in (np.float64, np.float32):
+        ws = EulerWorkspace(omega, idx, -0.3, 0.5, 1e-3, dtype=dtype)
+        theta = ws.phases(np.random.default_rng(0).uniform(0, 2 * np.pi, len(omega)))
+        ws.step(theta)
+
+        tracemalloc.start()
+        for _ in range(100):
+            ws.step(theta)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # A single temporary phase vector would show up as theta.nbytes
+        assert peak < theta.nbytes / 4
+
+
+def test_euler_workspace_step_matches_explicit_euler():
+    omega, idx = goldbach_system(500)
+    theta0 = np.random.default_rng(1).uniform(0, 2 * np.pi, len(omega))
+    ws = EulerWorkspace(omega, idx, -0.3, 0.5, 1e-3)
+    theta = ws.phases(theta0)
+    R = ws.step(theta)
+
+    force = (omega - 0.3 * np.sin(theta0[idx] - theta0)
+             + 0.5 * mean_field_coupling(theta0))
+    np.testing.assert_allclose(theta, theta0 + 1e-3 * force, atol=1e-12)
+    np.testing.assert_allclose(R, order_parameter(theta0), atol=1e-12)
+
+
+def test_pair_flow_is_exact():
+    # Drifting, locking and unpaired oscillators all appear for N = 100
+    omega, idx = goldbach_system(100)
+    M = len(omega)
+    theta0 = np.random.default_rng(2).uniform(0, 2 * np.pi, M)
+    for K in (20.0, 500.0, 2000.0):
+        ref = solve_ivp(goldbach_rhs_ivp, (0, 3.0), theta0, args=(omega, idx, K, M),
+                        method='DOP853', rtol=1e-12, atol=1e-12).y[:, -1]
+        np.testing.assert_allclose(pair_flow(theta0, omega, idx, -K / M, 3.0), ref, atol=1e-7)
+        theta, n_evals = rotating_frame_integrate(omega, idx, -K / M, theta0, 3.0)
+        assert n_evals == 0
+        np.testing.assert_allclose(theta, ref, atol=1e-7)
+
+
+def test_noisy_ensemble_independent_of_workers_and_chunks():
+    omega = np.log(get_primes(60).astype(float))
+    kappas = np.linspace(0.0, 2.0, 7)
+    args = (omega, kappas, 0.01, 50, mean_field_coupling, 0.3)
+
+    reference = noisy_ensemble(*args, seed=5, n_workers=1, chunk_size=16)
+    for n_workers, chunk_size in ((1, 1), (1, 3), (2, 2)):
+        theta = noisy_ensemble(*args, seed=5, n_workers=n_workers, chunk_size=chunk_size)
+        np.testing.assert_array_equal(theta, reference)
@@ -0,0 +1,42 @@
+import numpy as np
+
+from goldbach_primes import get_primes, goldbach_matrix, goldbach_partners
+from kuramoto_kernels import (dense_coupling, dense_rhs, goldbach_rhs, mean_field_coupling,
+                              partner_coupling, partner_index)
+
+
+def dense_sin(theta, W):
+    # The M x M form the kernels replace: sum_j W_ij sin(theta_j - theta_i)
+    return np.sum(W * np.sin(theta[None, :] - theta[:, None]), axis=1)
+
+
+def goldbach_system(N):
+    primes = get_primes(N)
+    idx = partner_index(goldbach_partners(N, primes.astype(np.int64)))
+    return primes.astype(float), idx, goldbach_matrix(N, primes)
+
+
+def test_mean_field_coupling_matches_dense():
+    theta = np.random.default_rng(0).uniform(0, 2 * np.pi, (3, 50))
+    expected = np.stack([dense_sin(row, np.ones((50, 50))) / 50 for row in theta])
+
+    np.testing.assert_allclose(mean_field_coupling(theta), expected, atol=1e-12)
+
+
+def test_partner_coupling_matches_goldbach_matrix():
+    primes, idx, W = goldbach_system(200)
+    theta = np.random.default_rng(1).uniform(0, 2 * np.pi, len(primes))
+
+    np.testing.assert_allclose(partner_coupling(theta, idx), dense_sin(theta, W), atol=1e-12)
+    np.testing.assert_allclose(goldbach_rhs(theta, 0.0, primes, idx, 300.0, len(primes)),
+                               dense_rhs(theta, 0.0, primes, W, 300.0, len(primes)),
+                               atol=1e-9)
+
+
+def test_dense_coupling_matches_dense_sin():
+    rng = np.random.default_rng(2)
+    W = rng.random((40, 40))
+    theta = rng.uniform(0, 2 * np.pi, (2, 40))
+
+    np.testing.assert_allclose(dense_coupling(theta, W),
+                               np.stack([dense_sin(row, W) for row in theta]), atol=1e-12)
@@ -0,0 +1,37 @@
+import importlib.util
+import os
+
+import numpy as np
+
+# The script's file name (simulate_system.py.py) is not importable by name
+_spec = importlib.util.spec_from_file_location(
+    'simulate_system', os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    'simulate_system.py.py'))
+simulate_system = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(simulate_system)
+
+
+def test_edge_list_ode_matches_dense_adjacency():
+    system = simulate_system.PrimeSynchronization(N=100)
+    theta = np.random.default_rng(0).uniform(0, 2 * np.pi, system.m)
+    A = system.adjacency
+    dense = system.frequencies + (150.0 / system.avg_degree) * np.sum(
+        A * np.sin(theta[None, :] - theta[:, None]), axis=1)
+
+    np.testing.assert_allclose(system.kuramoto_ode(0.0, theta, 150.0), dense, atol=1e-12)
+
+
+def test_jacobian_matches_finite_differences():
+    system = simulate_system.PrimeSynchronization(N=100)
+    theta = np.random.default_rng(1).uniform(0, 2 * np.pi, system.m)
+    J = system.kuramoto_jacobian(0.0, theta, 150.0).toarray()
+
+    h = 1e-6
+    fd = np.empty_like(J)
+    for j in range(system.m):
+        e = np.zeros(system.m)
+        e[j] = h
+        fd[:, j] = (system.kuramoto_ode(0.0, theta + e, 150.0)
+                    - system.kuramoto_ode(0.0, theta - e, 150.0)) / (2 * h)
+
+    np.testing.assert_allclose(J, fd, atol=1e-6)